@@ -3,78 +3,103 @@ Local cluster management module using Kind for lightweight Kubernetes clusters.
 Replaces the heavy EKS cluster creation with fast local development environments.
 """
 
+import asyncio
 import click
 import json
+import os
 import subprocess
 import yaml
 from datetime import datetime
 from pathlib import Path
-import tempfile
-
-# Import from parent directory
-import sys
-sys.path.append(str(Path(__file__).parent.parent))
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Tuple
+
+# Optional Kubernetes Python client; kubectl is used when it is not installed
+try:
+    from kubernetes import client as k8s_client, config as k8s_config
+except ImportError:
+    k8s_client = None
+    k8s_config = None
+
+# config.py lives at the project root, which is on sys.path when the CLI runs
 from config import PlatformConfig, PLATFORM_DIR
+from modules.utils_module import atomic_write_bytes, load_json, write_json_file
 
 # Local cluster configuration directory
 LOCAL_CLUSTERS_DIR = PLATFORM_DIR / "local_clusters"
 LOCAL_CLUSTERS_DIR.mkdir(exist_ok=True)
 
-# Kind cluster presets optimized for different use cases
-CLUSTER_PRESETS = {
-    "development": {
-        "description": "Lightweight development cluster",
-        "nodes": {
-            "control_plane": 1,
-            "workers": 1
-        },
-        "features": {
-            "ingress": True,
-            "registry": True,
-            "database": True,
-            "port_forwards": [80, 443, 8080, 5432, 3306]
-        },
-        "resources": {
-            "cpu": "2",
-            "memory": "4Gi"
-        }
-    },
-    "performance": {
-        "description": "Higher resource cluster for performance testing",
-        "nodes": {
-            "control_plane": 1,
-            "workers": 2
-        },
-        "features": {
-            "ingress": True,
-            "registry": True,
-            "database": True,
-            "port_forwards": [80, 443, 8080, 5432, 3306, 1521]
-        },
-        "resources": {
-            "cpu": "4",
-            "memory": "8Gi"
-        }
-    },
-    "customer-reproduction": {
-        "description": "Multi-node cluster for customer issue reproduction",
-        "nodes": {
-            "control_plane": 1,
-            "workers": 3
-        },
-        "features": {
-            "ingress": True,
-            "registry": True,
-            "database": True,
-            "monitoring": True,
-            "port_forwards": [80, 443, 8080, 5432, 3306, 1521, 9000]
-        },
-        "resources": {
-            "cpu": "6",
-            "memory": "12Gi"
+# Kind node image, pulled once and passed explicitly to `kind create`
+# (pinned by digest, as kind's release notes recommend; this is the kind v0.23.0 build)
+NODE_IMAGE = os.environ.get(
+    "PLATFORM_KIND_NODE_IMAGE",
+    "kindest/node:v1.30.0@sha256:047357ac0cfea04663786a612ba1eaba9702bef25227a794b52890dd8bcd692e"
+)
+
+# Kubernetes API clients keep one connection pool per kubeconfig context
+K8S_CONNECTION_POOL_SIZE = 32
+_K8S_API_CLIENTS = {}
+
+@dataclass(frozen=True)
+class ClusterPreset:
+    """Immutable Kind cluster preset"""
+    description: str
+    workers: int
+    port_forwards: Tuple[int, ...]
+    cpu: str
+    memory: str
+    control_plane: int = 1
+    ingress: bool = True
+    registry: bool = True
+    database: bool = True
+    monitoring: bool = False
+
+    @property
+    def features(self):
+        """Feature flags as a plain dict, as stored in cluster metadata"""
+        features = {
+            "ingress": self.ingress,
+            "registry": self.registry,
+            "database": self.database,
+            "port_forwards": list(self.port_forwards)
         }
-    }
-}
+        if self.monitoring:
+            features["monitoring"] = True
+        return features
+
+
+# Kind cluster presets optimized for different use cases
+CLUSTER_PRESETS = MappingProxyType({
+    "development": ClusterPreset(
+        description="Lightweight development cluster",
+        workers=1,
+        port_forwards=(80, 443, 8080, 5432, 3306),
+        cpu="2",
+        memory="4Gi"
+    ),
+    "performance": ClusterPreset(
+        description="Higher resource cluster for performance testing",
+        workers=2,
+        port_forwards=(80, 443, 8080, 5432, 3306, 1521),
+        cpu="4",
+        memory="8Gi"
+    ),
+    "customer-reproduction": ClusterPreset(
+        description="Multi-node cluster for customer issue reproduction",
+        workers=3,
+        port_forwards=(80, 443, 8080, 5432, 3306, 1521, 9000),
+        cpu="6",
+        memory="12Gi",
+        monitoring=True
+    )
+})
+
+
+def _read_json_file(path):
+    """Read a JSON file"""
+    return load_json(Path(path).read_bytes())
 
 
 def check_kind_available():
@@ -179,6 +204,27 @@ def check_docker_available():
         return False
 
 
+def _docker_image_exists(image):
+    """Check if an image is present in the local Docker image cache"""
+    result = subprocess.run(['docker', 'image', 'inspect', image], capture_output=True)
+    return result.returncode == 0
+
+
+def ensure_node_image(image=NODE_IMAGE):
+    """Pull the Kind node image unless it is already cached locally"""
+    if _docker_image_exists(image):
+        return True
+
+    click.echo(f"📥 Pulling Kind node image (first run only, this can take a few minutes): {image}")
+    try:
+        # Let docker's progress output through so a long pull doesn't look hung
+        subprocess.run(['docker', 'pull', image], check=True)
+        return True
+    except subprocess.CalledProcessError as e:
+        click.echo(f"❌ Failed to pull Kind node image {image}: {e}")
+        return False
+
+
 def generate_kind_config(cluster_name, preset):
     """Generate Kind cluster configuration based on preset"""
     if preset not in CLUSTER_PRESETS:
@@ -208,27 +254,49 @@ nodeRegistration:
     }
 
     # Add port mappings for connectivity to external services
-    if preset_config["features"].get("port_forwards"):
-        control_plane_node["extraPortMappings"] = []
-        for port in preset_config["features"]["port_forwards"]:
-            control_plane_node["extraPortMappings"].append({
-                "containerPort": port,
-                "hostPort": port,
-                "protocol": "TCP"
-            })
+    if preset_config.port_forwards:
+        control_plane_node["extraPortMappings"] = [
+            {"containerPort": port, "hostPort": port, "protocol": "TCP"}
+            for port in preset_config.port_forwards
+        ]
 
     kind_config["nodes"].append(control_plane_node)
 
     # Add worker nodes
-    for i in range(preset_config["nodes"]["workers"]):
-        worker_node = {
-            "role": "worker"
-        }
-        kind_config["nodes"].append(worker_node)
+    kind_config["nodes"].extend({"role": "worker"} for _ in range(preset_config.workers))
 
     return kind_config
 
 
+# Safe YAML dumper, backed by libyaml when available
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _build_preset_templates():
+    """Pre-render the Kind configuration of every preset with a name placeholder"""
+    templates = {}
+    for preset in CLUSTER_PRESETS:
+        rendered = yaml.dump(generate_kind_config("__CLUSTER_NAME__", preset),
+                             Dumper=_YAML_DUMPER, default_flow_style=False)
+        # Escape literal braces so the template is safe for str.format
+        rendered = rendered.replace("{", "{{").replace("}", "}}")
+        templates[preset] = rendered.replace("__CLUSTER_NAME__", "{cluster_name}")
+    return templates
+
+
+# Only the cluster name varies between configs of the same preset
+_PRESET_YAML = _build_preset_templates()
+
+
+def render_kind_config(cluster_name, preset):
+    """Render Kind cluster configuration YAML from the precomputed preset template"""
+    if preset not in _PRESET_YAML:
+        raise ValueError(f"Unknown preset: {preset}")
+
+    # A JSON string is a valid double-quoted YAML scalar
+    return _PRESET_YAML[preset].format(cluster_name=json.dumps(cluster_name))
+
+
 def create_kind_cluster(cluster_name, preset="development"):
     """Create a Kind cluster with specified preset"""
 
@@ -255,24 +323,24 @@ def create_kind_cluster(cluster_name, preset="development"):
     preset_config = CLUSTER_PRESETS[preset]
 
     click.echo(f"🚀 Creating Kind cluster '{cluster_name}' with preset '{preset}'")
-    click.echo(f"📋 Configuration: {preset_config['description']}")
-    click.echo(f"   Control plane: {preset_config['nodes']['control_plane']}")
-    click.echo(f"   Workers: {preset_config['nodes']['workers']}")
-
-    # Generate Kind configuration
-    kind_config = generate_kind_config(cluster_name, preset)
+    click.echo(f"📋 Configuration: {preset_config.description}")
+    click.echo(f"   Control plane: {preset_config.control_plane}")
+    click.echo(f"   Workers: {preset_config.workers}")
 
     # Save Kind configuration
     cluster_dir = LOCAL_CLUSTERS_DIR / cluster_name
     cluster_dir.mkdir(exist_ok=True)
 
     config_file = cluster_dir / "kind-config.yaml"
-    with open(config_file, 'w') as f:
-        yaml.dump(kind_config, f, default_flow_style=False)
+    atomic_write_bytes(config_file, render_kind_config(cluster_name, preset).encode())
+
+    if not ensure_node_image():
+        raise click.Abort()
 
     try:
         # Create the cluster
-        cmd = ['kind', 'create', 'cluster', '--name', cluster_name, '--config', str(config_file)]
+        cmd = ['kind', 'create', 'cluster', '--name', cluster_name,
+               '--image', NODE_IMAGE, '--config', str(config_file)]
         click.echo(f"🔄 Running: {' '.join(cmd)}")
 
         result = subprocess.run(cmd, check=True, capture_output=True, text=True)
@@ -290,14 +358,13 @@ def create_kind_cluster(cluster_name, preset="development"):
             "preset": preset,
             "created_at": datetime.now().isoformat(),
             "kind_config_file": str(config_file),
-            "features": preset_config["features"],
+            "features": preset_config.features,
             "status": "running",
             "context_switched": switch_context_result
         }
 
         metadata_file = cluster_dir / "metadata.json"
-        with open(metadata_file, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        write_json_file(metadata_file, metadata)
 
         # Show connection info
         click.echo(f"\n📋 Cluster Info:")
@@ -312,7 +379,7 @@ def create_kind_cluster(cluster_name, preset="development"):
         click.echo(f"\n💡 Next Steps:")
         click.echo(f"   Prepare Starburst: python3 platform_cli.py starburst prepare --cluster {cluster_name}")
         click.echo(f"   Enable data sources: python3 platform_cli.py connect enable <source>")
-        if preset_config["features"].get("database"):
+        if preset_config.database:
             click.echo(f"   PostgreSQL ready: localhost:30432 (user: starburst, db: starburst)")
 
         return metadata
@@ -323,13 +390,61 @@ def create_kind_cluster(cluster_name, preset="development"):
         raise click.Abort()
 
 
+def create_kind_clusters(cluster_names, preset="development"):
+    """Create several Kind clusters concurrently, one worker process per cluster
+
+    Returns a dict mapping each cluster name to its metadata, or None if its
+    creation failed. Presets that map fixed host ports allow only one cluster
+    per call, since a second cluster could never bind the same ports.
+    """
+    if not cluster_names:
+        return {}
+
+    if preset not in CLUSTER_PRESETS:
+        raise ValueError(f"Unknown preset: {preset}. Available: {list(CLUSTER_PRESETS.keys())}")
+
+    host_ports = CLUSTER_PRESETS[preset].port_forwards
+    if len(cluster_names) > 1 and host_ports:
+        raise ValueError(
+            f"Preset '{preset}' binds fixed host ports {list(host_ports)}; "
+            f"create one cluster at a time ({len(cluster_names)} requested)"
+        )
+
+    # Pull the node image once up front so workers don't race N concurrent pulls
+    if not check_docker_available() or not ensure_node_image():
+        raise click.Abort()
+
+    max_workers = min(len(cluster_names), os.cpu_count() or 1)
+    results = {}
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(create_kind_cluster, cluster_name, preset): cluster_name
+            for cluster_name in cluster_names
+        }
+        for future in as_completed(futures):
+            cluster_name = futures[future]
+            try:
+                results[cluster_name] = future.result()
+            except (click.Abort, ValueError):
+                click.echo(f"❌ Failed to create cluster '{cluster_name}'")
+                results[cluster_name] = None
+            except Exception as e:
+                # Any other worker failure (OSError, BrokenProcessPool, ...) only
+                # fails this cluster; the rest of the batch keeps its results
+                click.echo(f"❌ Failed to create cluster '{cluster_name}': {e}")
+                results[cluster_name] = None
+
+    return {cluster_name: results[cluster_name] for cluster_name in cluster_names}
+
+
 def setup_cluster_features(cluster_name, preset_config):
     """Set up additional features like ingress controller"""
 
     context = f"kind-{cluster_name}"
 
     # Install ingress controller if enabled
-    if preset_config["features"].get("ingress"):
+    if preset_config.ingress:
         click.echo("🔗 Installing NGINX Ingress Controller...")
 
         ingress_cmd = [
@@ -356,11 +471,11 @@ def setup_cluster_features(cluster_name, preset_config):
             click.echo(f"⚠️ Warning: Failed to set up ingress controller: {e}")
 
     # Set up local registry if enabled
-    if preset_config["features"].get("registry"):
+    if preset_config.registry:
         setup_local_registry(cluster_name)
     
     # Set up local database if enabled
-    if preset_config["features"].get("database"):
+    if preset_config.database:
         setup_local_database(cluster_name)
 
 
@@ -586,6 +701,26 @@ def setup_local_registry(cluster_name):
         click.echo(f"⚠️ Warning: Failed to set up local registry: {e}")
 
 
+# Files the platform writes into a cluster directory
+CLUSTER_DIR_FILES = ("kind-config.yaml", "metadata.json", "postgres_port_forward.pid")
+
+
+def _remove_cluster_dir(cluster_dir):
+    """Remove a cluster directory, unlinking the known files directly"""
+    for name in CLUSTER_DIR_FILES:
+        try:
+            os.unlink(cluster_dir / name)
+        except FileNotFoundError:
+            pass
+
+    try:
+        os.rmdir(cluster_dir)
+    except OSError:
+        # Unexpected extra files - fall back to a full tree walk
+        import shutil
+        shutil.rmtree(cluster_dir, ignore_errors=True)
+
+
 def destroy_kind_cluster(cluster_name):
     """Destroy a Kind cluster and clean up all associated resources"""
     
@@ -668,8 +803,7 @@ def destroy_kind_cluster(cluster_name):
         click.echo("🔄 Cleaning up local files...")
         cluster_dir = LOCAL_CLUSTERS_DIR / cluster_name
         if cluster_dir.exists():
-            import shutil
-            shutil.rmtree(cluster_dir)
+            _remove_cluster_dir(cluster_dir)
             destruction_steps.append("✅ Local metadata cleaned")
         else:
             destruction_steps.append("⚠️  No local metadata found")
@@ -735,49 +869,143 @@ def check_cluster_exists(cluster_name):
         return False
 
 
-def list_local_clusters():
-    """List all local Kind clusters managed by the platform"""
+def get_kind_clusters():
+    """Get cluster names reported by `kind get clusters`"""
+    try:
+        result = subprocess.run(['kind', 'get', 'clusters'],
+                              capture_output=True, text=True, check=True)
+        return result.stdout.strip().split('\n') if result.stdout.strip() else []
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return []
+
+
+async def _probe_cluster_running(cluster_name):
+    """Check if a Kind cluster's API server answers `kubectl cluster-info`"""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            'kubectl', 'cluster-info', '--context', f'kind-{cluster_name}',
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+    except FileNotFoundError:
+        return False
+    return (await proc.wait()) == 0
+
+
+async def list_local_clusters_async(verify_with_kind=False):
+    """List all local Kind clusters managed by the platform
+
+    The local clusters directory is the source of truth for platform-managed
+    clusters, so no `kind` subprocess is needed. Pass verify_with_kind=True to
+    cross-check against `kind get clusters` and include external clusters.
+    Running-state probes for all clusters are issued concurrently.
+    """
 
     clusters = []
 
-    # Get Kind clusters
+    # Scan our metadata directory; scandir entries carry cached file types
     try:
-        result = subprocess.run(['kind', 'get', 'clusters'],
-                              capture_output=True, text=True, check=True)
-        kind_clusters = result.stdout.strip().split('\n') if result.stdout.strip() else []
-    except subprocess.CalledProcessError:
-        kind_clusters = []
+        entries = sorted(os.scandir(LOCAL_CLUSTERS_DIR), key=lambda entry: entry.name)
+    except FileNotFoundError:
+        entries = []
 
-    # Match with our metadata
-    for cluster_name in kind_clusters:
-        cluster_dir = LOCAL_CLUSTERS_DIR / cluster_name
-        metadata_file = cluster_dir / "metadata.json"
+    for entry in entries:
+        if not entry.is_dir():
+            continue
 
-        if metadata_file.exists():
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
+        metadata_file = Path(entry.path) / "metadata.json"
+        try:
+            metadata = _read_json_file(metadata_file)
+        except FileNotFoundError:
+            continue
 
-            # Check if cluster is actually running
-            try:
-                subprocess.run(['kubectl', 'cluster-info', '--context', f'kind-{cluster_name}'],
-                             capture_output=True, check=True)
-                metadata['running'] = True
-            except subprocess.CalledProcessError:
-                metadata['running'] = False
+        metadata.setdefault('name', entry.name)
+        clusters.append(metadata)
+
+    kind_clusters = get_kind_clusters() if verify_with_kind else None
 
-            clusters.append(metadata)
+    # Metadata left behind for a cluster kind no longer knows about is not probed
+    to_probe = []
+    for metadata in clusters:
+        if kind_clusters is not None and metadata['name'] not in kind_clusters:
+            metadata['running'] = False
         else:
-            # Kind cluster exists but no metadata - might be external
-            clusters.append({
-                'name': cluster_name,
-                'preset': 'unknown',
-                'running': True,
-                'created_at': 'unknown'
-            })
+            to_probe.append(metadata)
+
+    # Check if clusters are actually running
+    results = await asyncio.gather(*[_probe_cluster_running(m['name']) for m in to_probe])
+    for metadata, running in zip(to_probe, results):
+        metadata['running'] = running
+
+    if kind_clusters is not None:
+        managed = {metadata['name'] for metadata in clusters}
+        for cluster_name in kind_clusters:
+            if cluster_name not in managed:
+                # Kind cluster exists but no metadata - might be external
+                clusters.append({
+                    'name': cluster_name,
+                    'preset': 'unknown',
+                    'running': True,
+                    'created_at': 'unknown'
+                })
 
     return clusters
 
 
+def list_local_clusters(verify_with_kind=False):
+    """List all local Kind clusters managed by the platform (sync wrapper for the CLI)"""
+    return asyncio.run(list_local_clusters_async(verify_with_kind))
+
+
+def _get_core_v1_api(context):
+    """Get a CoreV1Api for a kubeconfig context, reusing its pooled ApiClient"""
+    api_client = _K8S_API_CLIENTS.get(context)
+    if api_client is None:
+        configuration = k8s_client.Configuration()
+        k8s_config.load_kube_config(context=context, client_configuration=configuration)
+        configuration.connection_pool_maxsize = K8S_CONNECTION_POOL_SIZE
+        api_client = k8s_client.ApiClient(configuration)
+        _K8S_API_CLIENTS[context] = api_client
+    return k8s_client.CoreV1Api(api_client)
+
+
+def get_node_details(context):
+    """Get name, status and kubelet version of each node, or None if unreachable"""
+    if k8s_client is not None:
+        try:
+            nodes = _get_core_v1_api(context).list_node(_request_timeout=10).items
+        except Exception:
+            # Drop the cached client so a recreated cluster gets fresh credentials
+            _K8S_API_CLIENTS.pop(context, None)
+            return None
+
+        return [
+            {
+                'name': node.metadata.name,
+                'status': node.status.conditions[-1].type,
+                'version': node.status.node_info.kubelet_version
+            }
+            for node in nodes
+        ]
+
+    try:
+        nodes_result = subprocess.run([
+            'kubectl', 'get', 'nodes', '--context', context, '-o', 'json'
+        ], capture_output=True, text=True, check=True)
+    except subprocess.CalledProcessError:
+        return None
+
+    nodes_data = load_json(nodes_result.stdout)
+    return [
+        {
+            'name': node['metadata']['name'],
+            'status': node['status']['conditions'][-1]['type'],
+            'version': node['status']['nodeInfo']['kubeletVersion']
+        }
+        for node in nodes_data['items']
+    ]
+
+
 def get_cluster_info(cluster_name):
     """Get detailed information about a specific cluster"""
 
@@ -787,30 +1015,18 @@ def get_cluster_info(cluster_name):
     if not metadata_file.exists():
         return None
 
-    with open(metadata_file, 'r') as f:
-        metadata = json.load(f)
+    metadata = _read_json_file(metadata_file)
 
     # Add runtime information
     context = f"kind-{cluster_name}"
 
-    try:
-        # Get node information
-        nodes_result = subprocess.run([
-            'kubectl', 'get', 'nodes', '--context', context, '-o', 'json'
-        ], capture_output=True, text=True, check=True)
-
-        nodes_data = json.loads(nodes_result.stdout)
-        metadata['nodes'] = len(nodes_data['items'])
-        metadata['node_details'] = [
-            {
-                'name': node['metadata']['name'],
-                'status': node['status']['conditions'][-1]['type'],
-                'version': node['status']['nodeInfo']['kubeletVersion']
-            }
-            for node in nodes_data['items']
-        ]
+    # Get node information
+    node_details = get_node_details(context)
 
-    except subprocess.CalledProcessError:
+    if node_details is not None:
+        metadata['nodes'] = len(node_details)
+        metadata['node_details'] = node_details
+    else:
         metadata['nodes'] = 'unknown'
         metadata['node_details'] = []
 
@@ -4,18 +4,55 @@ Manages shared databases, bastion hosts, and networking for the new architecture
 """
 
 import click
+import copy
 import json
 import subprocess
 import os
-import yaml
-from datetime import datetime
+import shutil
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial, wraps
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+# Optional in-process SSH key generation; ssh-keygen is used when missing
+try:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+except ImportError:
+    serialization = None
+
+# Optional Pulumi Automation API; the pulumi CLI is used when it is missing
+try:
+    import pulumi.automation as auto
+except ImportError:
+    auto = None
+
+# Optional cloud SDKs for in-process credential checks; the cloud CLIs are used when missing
+try:
+    import boto3
+    from botocore.config import Config as BotoConfig
+except ImportError:
+    boto3 = None
+
+try:
+    import google.auth as google_auth
+except ImportError:
+    google_auth = None
+
+try:
+    from azure.identity import DefaultAzureCredential
+except ImportError:
+    DefaultAzureCredential = None
+
 # Import from parent directory
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
-from config import PlatformConfig, PLATFORM_DIR
+from config import PlatformConfig, PLATFORM_DIR, get_user_database_config, validate_user_database_config
+from modules.utils_module import load_json, write_json_file
 
 # Pulumi configuration directory
 PULUMI_DIR = PLATFORM_DIR / "pulumi"
@@ -27,6 +64,18 @@ PULUMI_DIR.mkdir(exist_ok=True)
 STACKS_DIR.mkdir(exist_ok=True)
 OUTPUTS_DIR.mkdir(exist_ok=True)
 
+# How long tool/credential probe results and stack outputs are reused
+PROBE_CACHE_SECONDS = 60
+STACK_OUTPUTS_CACHE_SECONDS = 30
+
+# Pulumi CLI timeout (5 minutes) and lines of streamed output kept for error reporting
+PULUMI_COMMAND_TIMEOUT = 300
+STREAM_TAIL_LINES = 500
+
+# Concurrent stack operations; capped to stay clear of cloud API rate limits
+DEFAULT_STACK_PARALLELISM = 3
+MAX_STACK_PARALLELISM = 5
+
 # Stack configurations for different environments
 STACK_CONFIGS = {
     "shared-databases": {
@@ -49,25 +98,191 @@ STACK_CONFIGS = {
     }
 }
 
-def check_pulumi_available():
-    """Check if Pulumi CLI is available"""
+# Precomputed iteration orders and stack-name membership set
+_ALL_STACKS = tuple(STACK_CONFIGS)
+_ALL_STACKS_SET = frozenset(_ALL_STACKS)
+_ALL_CLOUDS = ("aws", "gcp", "azure")
+
+def ttl_cache(seconds: float = 60, cache_if=None):
+    """Cache results per positional args for `seconds`; pass force=True to refresh.
+    
+    When cache_if is given, only results for which cache_if(result) is true are stored.
+    """
+    def decorator(func):
+        entries = {}
+        lock = threading.Lock()
+        
+        @wraps(func)
+        def wrapper(*args, force: bool = False):
+            now = time.monotonic()
+            if not force:
+                with lock:
+                    entry = entries.get(args)
+                if entry is not None and now - entry[0] < seconds:
+                    return entry[1]
+            
+            # Computed outside the lock so different keys can load concurrently
+            value = func(*args)
+            if cache_if is None or cache_if(value):
+                with lock:
+                    entries[args] = (now, value)
+            return value
+        
+        def cache_clear():
+            with lock:
+                entries.clear()
+        
+        def invalidate(*args):
+            with lock:
+                entries.pop(args, None)
+        
+        wrapper.cache_clear = cache_clear
+        wrapper.invalidate = invalidate
+        return wrapper
+    return decorator
+
+# Serializes console output from stacks running on worker threads; each
+# worker sets a per-thread prefix so interleaved lines stay attributable
+_ECHO_LOCK = threading.Lock()
+_OUTPUT_CONTEXT = threading.local()
+
+def _echo(message: str = "") -> None:
+    """Thread-safe click.echo, prefixed with the current worker's stack name"""
+    prefix = getattr(_OUTPUT_CONTEXT, "prefix", "")
+    if prefix:
+        body = message.lstrip("\n")
+        message = message[:len(message) - len(body)] + prefix + body
+    with _ECHO_LOCK:
+        click.echo(message)
+
+def _with_output_prefix(stack_name: str, worker):
+    """Run worker(stack_name) with its output prefixed by [stack_name]"""
+    _OUTPUT_CONTEXT.prefix = f"[{stack_name}] "
     try:
-        result = subprocess.run(
-            ["pulumi", "version"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        return False
+        return worker(stack_name)
+    finally:
+        _OUTPUT_CONTEXT.prefix = ""
+
+def _run_stack_workers(worker, stacks: List[str], parallelism: int) -> Dict[str, Any]:
+    """Run a per-stack worker concurrently (bounded by parallelism), keeping stack order"""
+    results = {}
+    known_stacks = []
+    for stack_name in stacks:
+        if stack_name in _ALL_STACKS_SET:
+            results[stack_name] = None  # Filled in below, keeps stack order
+            known_stacks.append(stack_name)
+        else:
+            results[stack_name] = {"success": False, "error": f"Unknown stack: {stack_name}"}
+    
+    if known_stacks:
+        max_workers = max(1, min(parallelism, MAX_STACK_PARALLELISM, len(known_stacks)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_with_output_prefix, stack_name, worker) for stack_name in known_stacks]
+            for future in as_completed(futures):
+                stack_name, result = future.result()
+                results[stack_name] = result
+    
+    return results
+
+def _update_env_overrides() -> Dict[str, str]:
+    """Extra environment for pulumi up; PLATFORM_FAST=1 skips intermediate checkpoints"""
+    if os.environ.get("PLATFORM_FAST") != "1":
+        return {}
+    # State is persisted only once the update finishes. Much faster for large
+    # stacks, but if the update crashes mid-way the resources it created are
+    # missing from state and must be recovered with `pulumi refresh`/import.
+    return {"PULUMI_SKIP_CHECKPOINTS": "true", "PULUMI_EXPERIMENTAL": "true"}
+
+# Automation API workspace for PULUMI_DIR, created on first use
+_WORKSPACE = None
+_WORKSPACE_LOCK = threading.Lock()
+
+def _get_workspace():
+    """Get the shared Automation API workspace for the Pulumi project directory"""
+    global _WORKSPACE
+    if _WORKSPACE is None:
+        # Stack workers may race here; only one of them creates the workspace
+        with _WORKSPACE_LOCK:
+            if _WORKSPACE is None:
+                _WORKSPACE = auto.LocalWorkspace(work_dir=str(PULUMI_DIR))
+    return _WORKSPACE
+
+# Automation API Stack handles, selected once and reused across operations
+_STACK_CACHE = {}
+_STACK_CACHE_LOCK = threading.Lock()
+
+def _get_stack(stack_name: str, create: bool = False):
+    """Get a cached Stack handle, selecting (or creating) it on first use"""
+    with _STACK_CACHE_LOCK:
+        stack = _STACK_CACHE.get(stack_name)
+    if stack is None:
+        if create:
+            stack = auto.Stack.create_or_select(stack_name, _get_workspace())
+        else:
+            stack = auto.Stack.select(stack_name, _get_workspace())
+        with _STACK_CACHE_LOCK:
+            _STACK_CACHE[stack_name] = stack
+    return stack
+
+def _output_values(outputs) -> Dict[str, Any]:
+    """Flatten an Automation API OutputMap, masking secrets like `pulumi stack output` does"""
+    return {key: "[secret]" if output.secret else output.value for key, output in outputs.items()}
+
+def _automation_up(stack_name: str) -> Dict[str, Any]:
+    """Create/select a stack and run an update in-process via the Automation API"""
+    try:
+        env_overrides = _update_env_overrides()
+        if env_overrides:
+            # Fast-mode env goes on a dedicated workspace so it only affects this update
+            workspace = auto.LocalWorkspace(work_dir=str(PULUMI_DIR), env_vars=env_overrides)
+            stack = auto.Stack.create_or_select(stack_name, workspace)
+        else:
+            stack = _get_stack(stack_name, create=True)
+        stack.up(on_output=_echo)
+        outputs = _output_values(stack.outputs())
+        return {"success": True, "outputs": outputs, "error": None}
+    except Exception as e:
+        return {"success": False, "outputs": {}, "error": str(e)}
+    finally:
+        # Even a failed update may have changed resources
+        invalidate_stack_outputs(stack_name)
+
+def _automation_destroy(stack_name: str) -> Dict[str, Any]:
+    """Destroy a stack's resources in-process via the Automation API"""
+    try:
+        stack = _get_stack(stack_name)
+        stack.destroy(on_output=_echo)
+        return {"success": True, "error": None}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+    finally:
+        invalidate_stack_outputs(stack_name)
+
+@ttl_cache(seconds=PROBE_CACHE_SECONDS)
+def check_pulumi_available():
+    """Check if Pulumi CLI is available (a PATH lookup is enough)"""
+    return shutil.which("pulumi") is not None
+
+@lru_cache(maxsize=4)
+def _parse_pulumi_config(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a config file; keyed on mtime so edits are picked up"""
+    import yaml  # Deferred: only config loading needs it
+    
+    # libyaml-backed loader when available
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=loader)
 
 def load_pulumi_config() -> Dict[str, Any]:
     """Load infrastructure configuration from YAML"""
     config_file = PULUMI_DIR / "config.yaml"
-    if config_file.exists():
-        with open(config_file, 'r') as f:
-            return yaml.safe_load(f)
+    try:
+        mtime_ns = config_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        pass
+    else:
+        # Deep copy so callers can't mutate the cached parse
+        return copy.deepcopy(_parse_pulumi_config(str(config_file), mtime_ns))
     
     # Default configuration
     default_config = {
@@ -101,57 +316,154 @@ def load_pulumi_config() -> Dict[str, Any]:
         }
     }
     
-    # Save default config
+    # Save default config (libyaml-backed dumper when available)
+    import yaml
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
     with open(config_file, 'w') as f:
-        yaml.dump(default_config, f, default_flow_style=False)
+        yaml.dump(default_config, f, Dumper=dumper, default_flow_style=False)
     
     return default_config
 
-def validate_cloud_credentials() -> Dict[str, bool]:
-    """Verify AWS/GCP/Azure credentials are configured"""
-    results = {}
-    
-    # Check AWS credentials
+load_pulumi_config.cache_clear = _parse_pulumi_config.cache_clear
+
+# Identity probes per cloud: (command, text that must appear in stdout)
+_CREDENTIAL_PROBES = {
+    "aws": (["aws", "sts", "get-caller-identity"], None),
+    "gcp": (["gcloud", "auth", "list", "--filter=status:ACTIVE"], "ACTIVE"),
+    "azure": (["az", "account", "show"], None)
+}
+CREDENTIAL_PROBE_TIMEOUT = 10
+
+def _check_one_cloud(cmd: List[str], success_extra: str = None) -> bool:
+    """Run one credential probe; skipped when its CLI is not installed"""
+    if shutil.which(cmd[0]) is None:
+        return False
     try:
         result = subprocess.run(
-            ["aws", "sts", "get-caller-identity"],
+            cmd,
             capture_output=True,
             text=True,
-            timeout=10
+            timeout=CREDENTIAL_PROBE_TIMEOUT
         )
-        results["aws"] = result.returncode == 0
+        return result.returncode == 0 and (success_extra is None or success_extra in result.stdout)
     except (subprocess.TimeoutExpired, FileNotFoundError):
-        results["aws"] = False
-    
-    # Check GCP credentials
-    try:
-        result = subprocess.run(
-            ["gcloud", "auth", "list", "--filter=status:ACTIVE"],
-            capture_output=True,
-            text=True,
-            timeout=10
+        return False
+
+def _check_aws_sdk() -> bool:
+    """Check AWS credentials with an STS GetCallerIdentity call"""
+    # Explicit region: hosts without a default region would otherwise raise NoRegionError
+    sts = boto3.client(
+        "sts",
+        region_name="us-east-1",
+        config=BotoConfig(
+            connect_timeout=CREDENTIAL_PROBE_TIMEOUT,
+            read_timeout=CREDENTIAL_PROBE_TIMEOUT,
+            retries={"max_attempts": 1}
         )
-        results["gcp"] = result.returncode == 0 and "ACTIVE" in result.stdout
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        results["gcp"] = False
+    )
+    sts.get_caller_identity()
+    return True
+
+def _check_gcp_sdk() -> bool:
+    """Check that Application Default Credentials resolve
+    
+    Unlike `gcloud auth list`, this checks ADC (what Pulumi's GCP provider uses)
+    rather than the active gcloud account.
+    """
+    google_auth.default()
+    return True
+
+def _check_azure_sdk() -> bool:
+    """Check Azure credentials by requesting a management-plane token"""
+    DefaultAzureCredential().get_token("https://management.azure.com/.default")
+    return True
+
+# In-process checks per cloud, used instead of spawning the CLI when the SDK is installed
+_SDK_CREDENTIAL_CHECKS = {
+    "aws": _check_aws_sdk if boto3 is not None else None,
+    "gcp": _check_gcp_sdk if google_auth is not None else None,
+    "azure": _check_azure_sdk if DefaultAzureCredential is not None else None
+}
+
+def _run_bounded(check) -> bool:
+    """Run an SDK check on a daemon thread, giving up after CREDENTIAL_PROBE_TIMEOUT"""
+    outcome = []
     
-    # Check Azure credentials
+    def _target():
+        try:
+            outcome.append(bool(check()))
+        except Exception:
+            outcome.append(False)
+    
+    worker = threading.Thread(target=_target, daemon=True)
+    worker.start()
+    worker.join(CREDENTIAL_PROBE_TIMEOUT)
+    # A check that overran counts as unavailable; being a daemon it can't block exit
+    return bool(outcome) and outcome[0]
+
+def probe_cloud(cloud: str) -> bool:
+    """Check one cloud's credentials (uncached), via its SDK when available, else its CLI"""
+    sdk_check = _SDK_CREDENTIAL_CHECKS.get(cloud)
+    if sdk_check is None:
+        return _check_one_cloud(*_CREDENTIAL_PROBES[cloud])
+    return _run_bounded(sdk_check)
+
+@ttl_cache(seconds=PROBE_CACHE_SECONDS)
+def _cached_cloud_credentials() -> Dict[str, bool]:
+    """Probe AWS/GCP/Azure for configured credentials"""
+    # Probes are independent network round trips, so run them concurrently
+    with ThreadPoolExecutor(max_workers=len(_CREDENTIAL_PROBES)) as executor:
+        checks = executor.map(probe_cloud, _CREDENTIAL_PROBES)
+        return dict(zip(_CREDENTIAL_PROBES, checks))
+
+def validate_cloud_credentials(force: bool = False) -> Dict[str, bool]:
+    """Verify AWS/GCP/Azure credentials are configured (cached for PROBE_CACHE_SECONDS)"""
+    return _cached_cloud_credentials(force=force)
+
+validate_cloud_credentials.cache_clear = _cached_cloud_credentials.cache_clear
+
+def _stream_command(full_command: List[str], cwd: str, timeout: int, env: Dict[str, str] = None):
+    """Run a command, echoing merged output live and keeping only a bounded tail"""
+    tail = deque(maxlen=STREAM_TAIL_LINES)
+    timed_out = threading.Event()
+    
+    proc = subprocess.Popen(
+        full_command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        cwd=cwd,
+        env=env
+    )
+    
+    def _kill():
+        timed_out.set()
+        proc.kill()
+    
+    timer = threading.Timer(timeout, _kill)
+    timer.start()
     try:
-        result = subprocess.run(
-            ["az", "account", "show"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        results["azure"] = result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        results["azure"] = False
-    
-    return results
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            _echo(line)
+            tail.append(line)
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+    
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(full_command, timeout)
+    
+    return returncode, "\n".join(tail)
 
-def run_pulumi_command(command: List[str], stack_name: str = None, cwd: str = None) -> Dict[str, Any]:
+def run_pulumi_command(command: List[str], stack_name: str = None, cwd: str = None,
+                       stream: bool = False, env_overrides: Dict[str, str] = None,
+                       _assume_available: bool = False) -> Dict[str, Any]:
     """Execute Pulumi CLI commands with proper error handling"""
-    if not check_pulumi_available():
+    # Callers that already gated on check_pulumi_available() skip the re-check
+    if not _assume_available and not check_pulumi_available():
         return {
             "success": False,
             "error": "Pulumi CLI not available. Please install Pulumi first.",
@@ -168,15 +480,29 @@ def run_pulumi_command(command: List[str], stack_name: str = None, cwd: str = No
     if stack_name and "--stack" not in command:
         full_command.extend(["--stack", stack_name])
     
+    env = {**os.environ, **env_overrides} if env_overrides else None
+    
     try:
-        click.echo(f"=' Running: {' '.join(full_command)}")
+        _echo(f"=' Running: {' '.join(full_command)}")
+        
+        # Long-running commands echo live and keep only a bounded tail (stderr merged)
+        if stream:
+            returncode, output = _stream_command(full_command, cwd, PULUMI_COMMAND_TIMEOUT, env)
+            return {
+                "success": returncode == 0,
+                "returncode": returncode,
+                "stdout": output,
+                "stderr": output if returncode != 0 else "",
+                "command": ' '.join(full_command)
+            }
         
         result = subprocess.run(
             full_command,
             capture_output=True,
             text=True,
             cwd=cwd,
-            timeout=300  # 5 minutes timeout
+            env=env,
+            timeout=PULUMI_COMMAND_TIMEOUT
         )
         
         return {
@@ -202,30 +528,122 @@ def run_pulumi_command(command: List[str], stack_name: str = None, cwd: str = No
             "stderr": ""
         }
 
-def get_stack_outputs(stack_name: str) -> Dict[str, Any]:
-    """Get Pulumi stack outputs"""
+def run_pulumi_config_set_all(stack_name: str, values: Dict[str, str],
+                              secrets: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Set several stack config values with one `pulumi config set-all` call"""
+    if auto is not None:
+        # Reuse the shared workspace instead of assembling CLI arguments
+        config_map = {key: auto.ConfigValue(value=str(value)) for key, value in values.items()}
+        for key, value in (secrets or {}).items():
+            config_map[key] = auto.ConfigValue(value=str(value), secret=True)
+        try:
+            _get_workspace().set_all_config(stack_name, config_map)
+            return {"success": True, "stdout": "", "stderr": ""}
+        except Exception as e:
+            return {"success": False, "error": str(e), "stdout": "", "stderr": ""}
+        finally:
+            invalidate_stack_outputs(stack_name)
+    
+    command = ["config", "set-all"]
+    for key, value in values.items():
+        command.extend(["--plaintext", f"{key}={value}"])
+    for key, value in (secrets or {}).items():
+        command.extend(["--secret", f"{key}={value}"])
+    
+    result = run_pulumi_command(command, stack_name)
+    invalidate_stack_outputs(stack_name)
+    return result
+
+# Failed reads return {} and are not cached, so a transient error isn't sticky
+@ttl_cache(seconds=STACK_OUTPUTS_CACHE_SECONDS, cache_if=bool)
+def _cached_stack_outputs(stack_name: str) -> Dict[str, Any]:
+    """Read Pulumi stack outputs via the Automation API or the CLI"""
+    if auto is not None:
+        try:
+            return _output_values(_get_workspace().stack_outputs(stack_name))
+        except Exception as e:
+            _echo(f"L Failed to get stack outputs: {e}")
+            return {}
+    
     result = run_pulumi_command(["stack", "output", "--json"], stack_name)
     
     if result["success"]:
         try:
-            return json.loads(result["stdout"])
+            return load_json(result["stdout"])
         except json.JSONDecodeError:
-            click.echo(f"L Failed to parse stack outputs for {stack_name}")
+            _echo(f"L Failed to parse stack outputs for {stack_name}")
             return {}
     else:
-        click.echo(f"L Failed to get stack outputs: {result.get('error', result.get('stderr'))}")
+        _echo(f"L Failed to get stack outputs: {result.get('error', result.get('stderr'))}")
         return {}
 
-def provision_shared_infrastructure(stacks: List[str] = None) -> Dict[str, Any]:
+def get_stack_outputs(stack_name: str, force: bool = False) -> Dict[str, Any]:
+    """Get Pulumi stack outputs (cached briefly; see invalidate_stack_outputs)"""
+    # Deep copy so callers can't mutate the shared cache entry (outputs nest lists/dicts)
+    return copy.deepcopy(_cached_stack_outputs(stack_name, force=force))
+
+get_stack_outputs.invalidate = _cached_stack_outputs.invalidate
+get_stack_outputs.cache_clear = _cached_stack_outputs.cache_clear
+
+def invalidate_stack_outputs(stack_name: str) -> None:
+    """Drop cached outputs for a stack after it has been changed"""
+    get_stack_outputs.invalidate(stack_name)
+    _cached_infrastructure_status.cache_clear()
+
+def _provision_one_stack(stack_name: str):
+    """Select/create a single stack, run pulumi up and collect its outputs"""
+    config = STACK_CONFIGS[stack_name]
+    _echo(f"\n=� Provisioning stack: {config['name']}")
+    _echo(f"   Description: {config['description']}")
+    _echo(f"   Estimated monthly cost: ${config['estimated_cost_monthly']}")
+    
+    if auto is not None:
+        # Select, update and read outputs in-process
+        up_result = _automation_up(stack_name)
+        result = {
+            "success": up_result["success"],
+            "config": config,
+            "outputs": up_result["outputs"],
+            "error": up_result["error"]
+        }
+    else:
+        # Create/select stack
+        stack_result = run_pulumi_command(["stack", "select", stack_name, "--create"],
+                                          _assume_available=True)
+        
+        if not stack_result["success"]:
+            error = f"Failed to create/select stack: {stack_result.get('error', stack_result.get('stderr'))}"
+            _echo(f"L Stack {stack_name} failed: {error}")
+            return stack_name, {"success": False, "error": error}
+        
+        # Run pulumi up
+        up_result = run_pulumi_command(["up", "--yes"], stack_name, stream=True,
+                                       env_overrides=_update_env_overrides(),
+                                       _assume_available=True)
+        invalidate_stack_outputs(stack_name)
+        
+        result = {
+            "success": up_result["success"],
+            "config": config,
+            "outputs": get_stack_outputs(stack_name) if up_result["success"] else {},
+            "error": up_result.get("error", up_result.get("stderr")) if not up_result["success"] else None
+        }
+    
+    if result["success"]:
+        _echo(f" Stack {stack_name} provisioned successfully")
+    else:
+        _echo(f"L Stack {stack_name} failed: {result['error']}")
+    
+    return stack_name, result
+
+def provision_shared_infrastructure(stacks: List[str] = None,
+                                    parallelism: int = DEFAULT_STACK_PARALLELISM) -> Dict[str, Any]:
     """Deploy all shared resources across clouds"""
     if not check_pulumi_available():
         return {"success": False, "error": "Pulumi CLI not available"}
     
     if stacks is None:
-        stacks = list(STACK_CONFIGS.keys())
-    
-    results = {}
-    total_estimated_cost = 0
+        stacks = _ALL_STACKS
     
     click.echo("=� Starting shared infrastructure provisioning...")
     
@@ -241,53 +659,23 @@ def provision_shared_infrastructure(stacks: List[str] = None) -> Dict[str, Any]:
     
     click.echo(f" Valid credentials found for: {', '.join(available_clouds)}")
     
-    for stack_name in stacks:
-        if stack_name not in STACK_CONFIGS:
-            results[stack_name] = {"success": False, "error": f"Unknown stack: {stack_name}"}
-            continue
-        
-        config = STACK_CONFIGS[stack_name]
-        click.echo(f"\n=� Provisioning stack: {config['name']}")
-        click.echo(f"   Description: {config['description']}")
-        click.echo(f"   Estimated monthly cost: ${config['estimated_cost_monthly']}")
-        
-        # Create/select stack
-        stack_result = run_pulumi_command(["stack", "select", stack_name, "--create"])
-        
-        if not stack_result["success"]:
-            results[stack_name] = {
-                "success": False,
-                "error": f"Failed to create/select stack: {stack_result.get('error', stack_result.get('stderr'))}"
-            }
-            continue
-        
-        # Run pulumi up
-        up_result = run_pulumi_command(["up", "--yes"], stack_name)
-        
-        results[stack_name] = {
-            "success": up_result["success"],
-            "config": config,
-            "outputs": get_stack_outputs(stack_name) if up_result["success"] else {},
-            "error": up_result.get("error", up_result.get("stderr")) if not up_result["success"] else None
-        }
-        
-        if up_result["success"]:
-            total_estimated_cost += config["estimated_cost_monthly"]
-            click.echo(f" Stack {stack_name} provisioned successfully")
-        else:
-            click.echo(f"L Stack {stack_name} failed: {results[stack_name]['error']}")
+    # Stacks are independent, so deploy them concurrently
+    results = _run_stack_workers(_provision_one_stack, stacks, parallelism)
+    total_estimated_cost = sum(
+        result["config"]["estimated_cost_monthly"] for result in results.values() if result["success"]
+    )
     
-    # Save deployment metadata
+    # Save deployment metadata; one timestamp so the filename matches the contents
+    now = datetime.now(timezone.utc)
     deployment_metadata = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now.isoformat(),
         "stacks": results,
         "estimated_monthly_cost": total_estimated_cost,
         "available_clouds": available_clouds
     }
     
-    metadata_file = OUTPUTS_DIR / f"deployment_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(metadata_file, 'w') as f:
-        json.dump(deployment_metadata, f, indent=2)
+    metadata_file = OUTPUTS_DIR / f"deployment_{now.strftime('%Y%m%d_%H%M%S')}.json"
+    write_json_file(metadata_file, deployment_metadata)
     
     return {
         "success": all(r["success"] for r in results.values()),
@@ -296,113 +684,180 @@ def provision_shared_infrastructure(stacks: List[str] = None) -> Dict[str, Any]:
         "metadata_file": str(metadata_file)
     }
 
-def destroy_shared_infrastructure(stacks: List[str] = None) -> Dict[str, Any]:
+def _destroy_one_stack(stack_name: str):
+    """Run pulumi destroy for a single stack"""
+    _echo(f"\n=�  Destroying stack: {stack_name}")
+    
+    # Run pulumi destroy
+    if auto is not None:
+        destroy_result = _automation_destroy(stack_name)
+    else:
+        destroy_result = run_pulumi_command(["destroy", "--yes"], stack_name, stream=True,
+                                            _assume_available=True)
+        invalidate_stack_outputs(stack_name)
+    
+    result = {
+        "success": destroy_result["success"],
+        "error": destroy_result.get("error", destroy_result.get("stderr")) if not destroy_result["success"] else None
+    }
+    
+    if destroy_result["success"]:
+        _echo(f" Stack {stack_name} destroyed successfully")
+    else:
+        _echo(f"L Stack {stack_name} destruction failed: {result['error']}")
+    
+    return stack_name, result
+
+def destroy_shared_infrastructure(stacks: List[str] = None,
+                                  parallelism: int = DEFAULT_STACK_PARALLELISM) -> Dict[str, Any]:
     """Clean up shared infrastructure"""
+    if not check_pulumi_available():
+        return {"success": False, "error": "Pulumi CLI not available"}
+    
     if stacks is None:
-        stacks = list(STACK_CONFIGS.keys())
+        stacks = _ALL_STACKS
     
-    results = {}
     click.echo("=�  Starting infrastructure cleanup...")
     
-    for stack_name in stacks:
-        if stack_name not in STACK_CONFIGS:
-            results[stack_name] = {"success": False, "error": f"Unknown stack: {stack_name}"}
-            continue
-        
-        click.echo(f"\n=�  Destroying stack: {stack_name}")
-        
-        # Run pulumi destroy
-        destroy_result = run_pulumi_command(["destroy", "--yes"], stack_name)
-        
-        results[stack_name] = {
-            "success": destroy_result["success"],
-            "error": destroy_result.get("error", destroy_result.get("stderr")) if not destroy_result["success"] else None
-        }
-        
-        if destroy_result["success"]:
-            click.echo(f" Stack {stack_name} destroyed successfully")
-        else:
-            click.echo(f"L Stack {stack_name} destruction failed: {results[stack_name]['error']}")
+    results = _run_stack_workers(_destroy_one_stack, stacks, parallelism)
     
     return {
         "success": all(r["success"] for r in results.values()),
         "stacks": results
     }
 
-def get_infrastructure_status() -> Dict[str, Any]:
-    """Check status of shared resources"""
+def get_infrastructure_status(check_credentials: bool = False,
+                              stack_filter: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Check status of shared resources (credentials only probed when requested)"""
     if not check_pulumi_available():
         return {"error": "Pulumi CLI not available"}
     
     status = {
         "pulumi_available": True,
-        "credentials": validate_cloud_credentials(),
         "stacks": {}
     }
+    if check_credentials:
+        status["credentials"] = validate_cloud_credentials()
     
-    # List all stacks
-    list_result = run_pulumi_command(["stack", "ls", "--json"])
-    
-    if list_result["success"]:
+    # List all stacks once
+    if auto is not None:
         try:
-            stacks_data = json.loads(list_result["stdout"])
-            
-            for stack_info in stacks_data:
-                stack_name = stack_info.get("name", "").split("/")[-1]  # Get just the stack name
-                
-                if stack_name in STACK_CONFIGS:
-                    outputs = get_stack_outputs(stack_name)
-                    
-                    status["stacks"][stack_name] = {
-                        "exists": True,
-                        "last_update": stack_info.get("lastUpdate"),
-                        "resource_count": stack_info.get("resourceCount", 0),
-                        "url": stack_info.get("url"),
-                        "config": STACK_CONFIGS[stack_name],
-                        "outputs": outputs
-                    }
-            
-            # Check for missing stacks
-            for stack_name in STACK_CONFIGS:
-                if stack_name not in status["stacks"]:
-                    status["stacks"][stack_name] = {
-                        "exists": False,
-                        "config": STACK_CONFIGS[stack_name]
-                    }
-                    
+            stacks_data = [
+                {
+                    "name": summary.name,
+                    # ISO string, matching what `pulumi stack ls --json` reports
+                    "lastUpdate": summary.last_update.isoformat() if summary.last_update else None,
+                    "resourceCount": summary.resource_count,
+                    "url": summary.url
+                }
+                for summary in _get_workspace().list_stacks()
+            ]
+        except Exception as e:
+            status["error"] = f"Failed to list stacks: {e}"
+            return status
+    else:
+        list_result = run_pulumi_command(["stack", "ls", "--json"], _assume_available=True)
+        if not list_result["success"]:
+            status["error"] = f"Failed to list stacks: {list_result.get('stderr', '')}"
+            return status
+        
+        try:
+            stacks_data = load_json(list_result["stdout"])
         except json.JSONDecodeError:
             status["error"] = "Failed to parse stack list"
+            return status
+    
+    # Only report (and fetch outputs for) the requested stacks
+    wanted = _ALL_STACKS if stack_filter is None else tuple(s for s in _ALL_STACKS if s in stack_filter)
+    wanted_set = _ALL_STACKS_SET if stack_filter is None else frozenset(wanted)
+    
+    existing = {}
+    for stack_info in stacks_data:
+        stack_name = (stack_info.get("name") or "").split("/")[-1]  # Get just the stack name
+        if stack_name in wanted_set:
+            existing[stack_name] = stack_info
+    
+    # Output reads are independent, so fetch them concurrently
+    if existing:
+        with ThreadPoolExecutor(max_workers=len(existing)) as executor:
+            stack_outputs = dict(zip(existing, executor.map(get_stack_outputs, existing)))
+    
+    for stack_name, stack_info in existing.items():
+        status["stacks"][stack_name] = {
+            "exists": True,
+            "last_update": stack_info.get("lastUpdate"),
+            "resource_count": stack_info.get("resourceCount", 0),
+            "url": stack_info.get("url"),
+            "config": STACK_CONFIGS[stack_name],
+            "outputs": stack_outputs[stack_name]
+        }
+    
+    # Check for missing stacks
+    for stack_name in wanted:
+        if stack_name not in status["stacks"]:
+            status["stacks"][stack_name] = {
+                "exists": False,
+                "config": STACK_CONFIGS[stack_name]
+            }
     
     return status
 
+@ttl_cache(STACK_OUTPUTS_CACHE_SECONDS, cache_if=lambda status: "error" not in status)
+def _cached_infrastructure_status(stack_filter: Optional[tuple] = None) -> Dict[str, Any]:
+    """get_infrastructure_status() reused across back-to-back status queries"""
+    return get_infrastructure_status(stack_filter=stack_filter)
+
+def get_cached_infrastructure_status(stack_filter: Optional[tuple] = None, force: bool = False) -> Dict[str, Any]:
+    """Stack status without credentials, cached briefly and cleared when stacks change"""
+    # Deep copy so callers can't mutate the shared cache entry
+    return copy.deepcopy(_cached_infrastructure_status(stack_filter, force=force))
+
 # Multi-Cloud Database Management Functions
 
-def provision_shared_databases(clouds: List[str] = None) -> Dict[str, Any]:
-    """Create shared RDS, BigQuery, Synapse instances"""
-    if clouds is None:
-        clouds = ["aws", "gcp", "azure"]
-    
-    config = load_pulumi_config()
-    credentials = validate_cloud_credentials()
-    
+def _run_cloud_provisioners(provisioners: Dict[str, Any], clouds: List[str],
+                            credentials: Dict[str, bool], cloud_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Run per-cloud provisioners concurrently for clouds with valid credentials"""
     results = {}
-    
-    click.echo("🗄️  Provisioning shared databases...")
-    
+    runnable = []
     for cloud in clouds:
         if not credentials.get(cloud, False):
             results[cloud] = {
                 "success": False,
                 "error": f"No valid credentials for {cloud}"
             }
-            continue
+        elif cloud in provisioners:
+            results[cloud] = None  # Filled in below, keeps cloud order
+            runnable.append(cloud)
+    
+    if runnable:
+        with ThreadPoolExecutor(max_workers=len(runnable)) as executor:
+            futures = {cloud: executor.submit(provisioners[cloud], cloud_config) for cloud in runnable}
         
-        if cloud == "aws":
-            results[cloud] = _provision_aws_databases(config["databases"])
-        elif cloud == "gcp":
-            results[cloud] = _provision_gcp_databases(config["databases"])
-        elif cloud == "azure":
-            results[cloud] = _provision_azure_databases(config["databases"])
+        # One cloud failing must not hide the others' results
+        for cloud, future in futures.items():
+            error = future.exception()
+            if error is None:
+                results[cloud] = future.result()
+            else:
+                results[cloud] = {"success": False, "error": str(error)}
+    
+    return results
+
+def provision_shared_databases(clouds: List[str] = None, config: Dict[str, Any] = None,
+                               credentials: Dict[str, bool] = None) -> Dict[str, Any]:
+    """Create shared RDS, BigQuery, Synapse instances"""
+    if clouds is None:
+        clouds = _ALL_CLOUDS
+    
+    # Callers that already loaded config/credentials can pass them in
+    if config is None:
+        config = load_pulumi_config()
+    if credentials is None:
+        credentials = validate_cloud_credentials()
+    
+    click.echo("🗄️  Provisioning shared databases...")
+    
+    results = _run_cloud_provisioners(_DB_PROVISIONERS, clouds, credentials, config["databases"])
     
     return {
         "success": all(r.get("success", False) for r in results.values()),
@@ -412,32 +867,24 @@ def provision_shared_databases(clouds: List[str] = None) -> Dict[str, Any]:
 def _provision_aws_databases(db_config: Dict[str, Any]) -> Dict[str, Any]:
     """Provision AWS RDS instances"""
     databases = {}
+    engines = {"postgres": "postgresql", "mysql": "mysql"}
     
-    # PostgreSQL
-    if "postgres" in db_config:
-        postgres_result = run_pulumi_command([
-            "config", "set", "aws:postgres:instanceClass", db_config["postgres"]["instance_class"]
-        ], "shared-databases")
-        
-        databases["postgres"] = {
-            "success": postgres_result["success"],
-            "type": "postgresql",
-            "instance_class": db_config["postgres"]["instance_class"],
-            "allocated_storage": db_config["postgres"]["allocated_storage"]
-        }
-    
-    # MySQL
-    if "mysql" in db_config:
-        mysql_result = run_pulumi_command([
-            "config", "set", "aws:mysql:instanceClass", db_config["mysql"]["instance_class"]
-        ], "shared-databases")
+    # Apply all instance classes in a single config call
+    values = {
+        f"aws:{engine}:instanceClass": db_config[engine]["instance_class"]
+        for engine in engines if engine in db_config
+    }
+    if values:
+        result = run_pulumi_config_set_all("shared-databases", values)
         
-        databases["mysql"] = {
-            "success": mysql_result["success"],
-            "type": "mysql",
-            "instance_class": db_config["mysql"]["instance_class"],
-            "allocated_storage": db_config["mysql"]["allocated_storage"]
-        }
+        for engine, db_type in engines.items():
+            if engine in db_config:
+                databases[engine] = {
+                    "success": result["success"],
+                    "type": db_type,
+                    "instance_class": db_config[engine]["instance_class"],
+                    "allocated_storage": db_config[engine]["allocated_storage"]
+                }
     
     return {
         "success": all(db.get("success", False) for db in databases.values()),
@@ -487,12 +934,19 @@ def _provision_azure_databases(db_config: Dict[str, Any]) -> Dict[str, Any]:
         "cloud": "azure"
     }
 
-def get_database_endpoints() -> Dict[str, Any]:
+# Per-cloud provisioners, dispatched by provision_shared_databases
+_DB_PROVISIONERS = {
+    "aws": _provision_aws_databases,
+    "gcp": _provision_gcp_databases,
+    "azure": _provision_azure_databases
+}
+
+def get_database_endpoints(outputs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Return connection details for shared databases"""
     endpoints = {}
     
-    # Get outputs from shared-databases stack
-    stack_outputs = get_stack_outputs("shared-databases")
+    # Get outputs from shared-databases stack unless the caller already has them
+    stack_outputs = outputs if outputs is not None else get_stack_outputs("shared-databases")
     
     if stack_outputs:
         for db_name, db_info in stack_outputs.items():
@@ -507,57 +961,94 @@ def get_database_endpoints() -> Dict[str, Any]:
     
     return endpoints
 
-def update_database_security_groups(allowed_cidrs: List[str] = None) -> Dict[str, Any]:
-    """Manage access controls for shared databases"""
-    if allowed_cidrs is None:
-        allowed_cidrs = ["10.0.0.0/8", "172.16.0.0/12", "192.168.0.0/16"]  # Private networks
+def _automation_update_security_groups(stack_name: str, allowed_cidrs: List[str]) -> Dict[str, Any]:
+    """Set allowedCidrs and update only the security group via the Automation API"""
+    try:
+        stack = _get_stack(stack_name)
+        stack.set_config("allowedCidrs", auto.ConfigValue(value=",".join(allowed_cidrs)))
+        
+        # Target just the security group when the program exports its URN
+        sg_urn = stack.outputs().get("securityGroupUrn")
+        if sg_urn is not None:
+            stack.up(target=[sg_urn.value], on_output=_echo)
+        else:
+            stack.up(on_output=_echo)
+        
+        return {"success": True, "allowed_cidrs": allowed_cidrs, "error": None}
+    except Exception as e:
+        return {"success": False, "allowed_cidrs": allowed_cidrs, "error": str(e)}
+    finally:
+        invalidate_stack_outputs(stack_name)
+
+def _update_stack_security_groups(stack_name: str, allowed_cidrs: List[str]):
+    """Apply allowedCidrs to one stack and run the (targeted) update"""
+    if auto is not None:
+        return stack_name, _automation_update_security_groups(stack_name, allowed_cidrs)
     
-    result = run_pulumi_command([
-        "config", "set", "allowedCidrs", ",".join(allowed_cidrs)
-    ], "shared-databases")
+    result = run_pulumi_config_set_all(stack_name, {
+        "allowedCidrs": ",".join(allowed_cidrs)
+    })
     
     if result["success"]:
-        # Trigger stack update to apply new security group rules
-        update_result = run_pulumi_command(["up", "--yes"], "shared-databases")
-        return {
+        # Trigger stack update to apply new security group rules, scoped to
+        # the security group when the program exports its URN
+        command = ["up", "--yes"]
+        sg_urn = get_stack_outputs(stack_name).get("securityGroupUrn")
+        if sg_urn and sg_urn != "[secret]":
+            command.extend(["--target", sg_urn])
+        
+        update_result = run_pulumi_command(command, stack_name, stream=True)
+        invalidate_stack_outputs(stack_name)
+        return stack_name, {
             "success": update_result["success"],
             "allowed_cidrs": allowed_cidrs,
             "error": update_result.get("error") if not update_result["success"] else None
         }
     
-    return {
+    return stack_name, {
         "success": False,
         "error": "Failed to update security group configuration"
     }
 
+def update_database_security_groups(allowed_cidrs: List[str] = None,
+                                    stacks: List[str] = ("shared-databases",)) -> Dict[str, Any]:
+    """Manage access controls for shared databases"""
+    if allowed_cidrs is None:
+        allowed_cidrs = ["10.0.0.0/8", "172.16.0.0/12", "192.168.0.0/16"]  # Private networks
+    
+    # Each stack gets one batched config write; the updates then run concurrently
+    results = _run_stack_workers(
+        partial(_update_stack_security_groups, allowed_cidrs=allowed_cidrs),
+        stacks,
+        DEFAULT_STACK_PARALLELISM
+    )
+    
+    if len(results) == 1:
+        return next(iter(results.values()))
+    
+    return {
+        "success": all(r["success"] for r in results.values()),
+        "allowed_cidrs": allowed_cidrs,
+        "stacks": results
+    }
+
 # Connectivity Infrastructure Functions
 
-def provision_bastion_hosts(clouds: List[str] = None) -> Dict[str, Any]:
+def provision_bastion_hosts(clouds: List[str] = None, config: Dict[str, Any] = None,
+                            credentials: Dict[str, bool] = None) -> Dict[str, Any]:
     """Create bastion hosts for SSH tunneling"""
     if clouds is None:
-        clouds = ["aws", "gcp", "azure"]
-    
-    config = load_pulumi_config()
-    credentials = validate_cloud_credentials()
+        clouds = _ALL_CLOUDS
     
-    results = {}
+    # Callers that already loaded config/credentials can pass them in
+    if config is None:
+        config = load_pulumi_config()
+    if credentials is None:
+        credentials = validate_cloud_credentials()
     
     click.echo("🔐 Provisioning bastion hosts...")
     
-    for cloud in clouds:
-        if not credentials.get(cloud, False):
-            results[cloud] = {
-                "success": False,
-                "error": f"No valid credentials for {cloud}"
-            }
-            continue
-        
-        if cloud == "aws":
-            results[cloud] = _provision_aws_bastion(config["bastions"])
-        elif cloud == "gcp":
-            results[cloud] = _provision_gcp_bastion(config["bastions"])
-        elif cloud == "azure":
-            results[cloud] = _provision_azure_bastion(config["bastions"])
+    results = _run_cloud_provisioners(_BASTION_PROVISIONERS, clouds, credentials, config["bastions"])
     
     return {
         "success": all(r.get("success", False) for r in results.values()),
@@ -566,14 +1057,10 @@ def provision_bastion_hosts(clouds: List[str] = None) -> Dict[str, Any]:
 
 def _provision_aws_bastion(bastion_config: Dict[str, Any]) -> Dict[str, Any]:
     """Provision AWS EC2 bastion host"""
-    result = run_pulumi_command([
-        "config", "set", "aws:bastion:instanceType", bastion_config["instance_type"]
-    ], "connectivity")
-    
-    if result["success"]:
-        result = run_pulumi_command([
-            "config", "set", "aws:bastion:keyPair", bastion_config["key_pair_name"]
-        ], "connectivity")
+    result = run_pulumi_config_set_all("connectivity", {
+        "aws:bastion:instanceType": bastion_config["instance_type"],
+        "aws:bastion:keyPair": bastion_config["key_pair_name"]
+    })
     
     return {
         "success": result["success"],
@@ -598,12 +1085,20 @@ def _provision_azure_bastion(bastion_config: Dict[str, Any]) -> Dict[str, Any]:
         "cloud": "azure"
     }
 
+# Per-cloud provisioners, dispatched by provision_bastion_hosts
+_BASTION_PROVISIONERS = {
+    "aws": _provision_aws_bastion,
+    "gcp": _provision_gcp_bastion,
+    "azure": _provision_azure_bastion
+}
+
 def setup_vpc_networking() -> Dict[str, Any]:
     """Configure VPCs, subnets, security groups"""
     click.echo("🌐 Setting up VPC networking...")
     
     # Configure networking stack
-    result = run_pulumi_command(["up", "--yes"], "connectivity")
+    result = run_pulumi_command(["up", "--yes"], "connectivity", stream=True)
+    invalidate_stack_outputs("connectivity")
     
     if result["success"]:
         outputs = get_stack_outputs("connectivity")
@@ -619,6 +1114,59 @@ def setup_vpc_networking() -> Dict[str, Any]:
         "error": result.get("error", result.get("stderr"))
     }
 
+def _generate_ssh_key_pair(cloud: str, private_key_path: Path, public_key_path: Path,
+                           key_type: str = "ed25519") -> Dict[str, Any]:
+    """Generate one bastion key pair, in-process when cryptography is installed"""
+    comment = f"platform-bastion-{cloud}"
+    try:
+        if serialization is not None:
+            if key_type == "rsa":
+                key = rsa.generate_private_key(public_exponent=65537, key_size=4096)
+            else:
+                key = ed25519.Ed25519PrivateKey.generate()
+            
+            private_bytes = key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.OpenSSH,
+                serialization.NoEncryption()
+            )
+            public_bytes = key.public_key().public_bytes(
+                serialization.Encoding.OpenSSH,
+                serialization.PublicFormat.OpenSSH
+            )
+            
+            # Create the private key with owner-only permissions from the start
+            fd = os.open(private_key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(private_bytes)
+            public_key_path.write_bytes(public_bytes + f" {comment}\n".encode())
+        else:
+            command = ["ssh-keygen", "-t", key_type]
+            if key_type == "rsa":
+                command.extend(["-b", "4096"])
+            subprocess.run(command + [
+                "-f", str(private_key_path),
+                "-N", "",  # No passphrase
+                "-C", comment
+            ], check=True, capture_output=True)
+        
+        # Set proper permissions
+        private_key_path.chmod(0o600)
+        public_key_path.chmod(0o644)
+        
+        return {
+            "success": True,
+            "private_key": str(private_key_path),
+            "public_key": str(public_key_path),
+            "generated": True
+        }
+        
+    except (subprocess.CalledProcessError, OSError) as e:
+        return {
+            "success": False,
+            "error": f"Failed to generate key pair: {e}"
+        }
+
 def manage_ssh_key_pairs() -> Dict[str, Any]:
     """Handle SSH key management for bastions"""
     click.echo("🔑 Managing SSH key pairs...")
@@ -626,39 +1174,18 @@ def manage_ssh_key_pairs() -> Dict[str, Any]:
     ssh_dir = PLATFORM_DIR / "ssh_keys"
     ssh_dir.mkdir(exist_ok=True)
     
+    key_type = os.environ.get("PLATFORM_SSH_KEY_TYPE", "ed25519")
     key_pairs = {}
+    missing = {}
     
     # Generate key pairs for each cloud if they don't exist
-    for cloud in ["aws", "gcp", "azure"]:
+    for cloud in _ALL_CLOUDS:
         private_key_path = ssh_dir / f"{cloud}_bastion_key"
         public_key_path = ssh_dir / f"{cloud}_bastion_key.pub"
         
         if not private_key_path.exists():
-            try:
-                # Generate SSH key pair
-                subprocess.run([
-                    "ssh-keygen", "-t", "rsa", "-b", "4096",
-                    "-f", str(private_key_path),
-                    "-N", "",  # No passphrase
-                    "-C", f"platform-bastion-{cloud}"
-                ], check=True, capture_output=True)
-                
-                # Set proper permissions
-                private_key_path.chmod(0o600)
-                public_key_path.chmod(0o644)
-                
-                key_pairs[cloud] = {
-                    "success": True,
-                    "private_key": str(private_key_path),
-                    "public_key": str(public_key_path),
-                    "generated": True
-                }
-                
-            except subprocess.CalledProcessError as e:
-                key_pairs[cloud] = {
-                    "success": False,
-                    "error": f"Failed to generate key pair: {e}"
-                }
+            missing[cloud] = (private_key_path, public_key_path)
+            key_pairs[cloud] = None  # Filled in below, keeps cloud order
         else:
             key_pairs[cloud] = {
                 "success": True,
@@ -667,6 +1194,21 @@ def manage_ssh_key_pairs() -> Dict[str, Any]:
                 "generated": False
             }
     
+    if missing:
+        # In-process RSA keygen is CPU-bound, so spread it across processes;
+        # ssh-keygen and ed25519 are cheap enough for threads
+        cpu_bound = serialization is not None and key_type == "rsa"
+        executor_cls = ProcessPoolExecutor if cpu_bound else ThreadPoolExecutor
+        max_workers = min(len(missing), os.cpu_count() or 1) if cpu_bound else len(missing)
+        
+        with executor_cls(max_workers=max_workers) as executor:
+            futures = {
+                cloud: executor.submit(_generate_ssh_key_pair, cloud, private_key_path, public_key_path, key_type)
+                for cloud, (private_key_path, public_key_path) in missing.items()
+            }
+            for cloud, future in futures.items():
+                key_pairs[cloud] = future.result()
+    
     return {
         "success": all(kp.get("success", False) for kp in key_pairs.values()),
         "key_pairs": key_pairs
@@ -684,9 +1226,13 @@ def get_infrastructure_costs() -> Dict[str, Any]:
         "savings": {}
     }
     
+    # Output reads are independent, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=len(_ALL_STACKS)) as executor:
+        all_outputs = dict(zip(_ALL_STACKS, executor.map(get_stack_outputs, _ALL_STACKS)))
+    
     # Get cost estimates from each stack
     for stack_name, config in STACK_CONFIGS.items():
-        stack_outputs = get_stack_outputs(stack_name)
+        stack_outputs = all_outputs[stack_name]
         
         costs["breakdown"][stack_name] = {
             "estimated_monthly": config["estimated_cost_monthly"],
@@ -716,7 +1262,7 @@ def optimize_resource_sizing() -> Dict[str, Any]:
     recommendations = {}
     
     # Analyze each stack for optimization opportunities
-    for stack_name in STACK_CONFIGS.keys():
+    for stack_name in _ALL_STACKS:
         stack_outputs = get_stack_outputs(stack_name)
         
         if stack_outputs and "metrics" in stack_outputs:
@@ -732,11 +1278,7 @@ def optimize_resource_sizing() -> Dict[str, Any]:
     return {
         "success": True,
         "recommendations": recommendations,
-        "potential_monthly_savings": sum(
-            rec.get("potential_savings", 0) 
-            for rec in recommendations.values() 
-            if isinstance(rec, dict)
-        )
+        "potential_monthly_savings": sum(rec.get("total_savings", 0) for rec in recommendations.values())
     }
 
 def _analyze_resource_usage(metrics: Dict[str, Any]) -> Dict[str, Any]:
@@ -744,7 +1286,8 @@ def _analyze_resource_usage(metrics: Dict[str, Any]) -> Dict[str, Any]:
     recommendations = {
         "cpu_utilization": metrics.get("avg_cpu", 0),
         "memory_utilization": metrics.get("avg_memory", 0),
-        "recommendations": []
+        "recommendations": [],
+        "total_savings": 0
     }
     
     # CPU-based recommendations
@@ -755,6 +1298,7 @@ def _analyze_resource_usage(metrics: Dict[str, Any]) -> Dict[str, Any]:
             "reason": "Low CPU utilization",
             "potential_savings": 50
         })
+        recommendations["total_savings"] += 50
     elif recommendations["cpu_utilization"] > 80:
         recommendations["recommendations"].append({
             "type": "upsize",
@@ -771,6 +1315,7 @@ def _analyze_resource_usage(metrics: Dict[str, Any]) -> Dict[str, Any]:
             "reason": "Low memory utilization",
             "potential_savings": 30
         })
+        recommendations["total_savings"] += 30
     
     return recommendations
 
@@ -792,12 +1337,13 @@ def schedule_resource_scaling() -> Dict[str, Any]:
         }
     }
     
-    # Configure scaling for each stack
+    # Configure scaling for each stack; the payload is identical, so encode it once
+    scaling_payload = json.dumps(schedules)
     scaling_config = {}
-    for stack_name in STACK_CONFIGS.keys():
-        result = run_pulumi_command([
-            "config", "set", f"{stack_name}:scaling", json.dumps(schedules)
-        ], stack_name)
+    for stack_name in _ALL_STACKS:
+        result = run_pulumi_config_set_all(stack_name, {
+            f"{stack_name}:scaling": scaling_payload
+        })
         
         scaling_config[stack_name] = {
             "success": result["success"],
@@ -819,11 +1365,13 @@ def export_connection_profiles() -> Dict[str, Any]:
     
     profiles = {}
     
-    # Get database endpoints
-    db_endpoints = get_database_endpoints()
+    # Fetch database and bastion host outputs in one concurrent batch
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        db_outputs, connectivity_outputs = executor.map(
+            get_stack_outputs, ["shared-databases", "connectivity"]
+        )
     
-    # Get bastion host information
-    connectivity_outputs = get_stack_outputs("connectivity")
+    db_endpoints = get_database_endpoints(db_outputs)
     bastions = connectivity_outputs.get("bastions", {})
     
     # Create connection profiles for each database
@@ -847,8 +1395,7 @@ def export_connection_profiles() -> Dict[str, Any]:
     profiles_file = PLATFORM_DIR / "connectivity" / "shared_profiles.json"
     profiles_file.parent.mkdir(exist_ok=True)
     
-    with open(profiles_file, 'w') as f:
-        json.dump(profiles, f, indent=2)
+    write_json_file(profiles_file, profiles)
     
     return {
         "success": True,
@@ -857,34 +1404,49 @@ def export_connection_profiles() -> Dict[str, Any]:
         "profiles": profiles
     }
 
-def backup_infrastructure_state() -> Dict[str, Any]:
+def _backup_one_stack(stack_name: str, backup_dir: Path, show_secrets: bool = False):
+    """Export a single stack's state straight to a file in backup_dir"""
+    backup_file = backup_dir / f"{stack_name}_state.json"
+    command = ["stack", "export", "--file", str(backup_file)]
+    if show_secrets:
+        command.append("--show-secrets")
+    
+    export_result = run_pulumi_command(command, stack_name)
+    
+    if export_result["success"]:
+        try:
+            size = backup_file.stat().st_size
+        except OSError as e:
+            # Export claimed success but left no readable file; fail this stack only
+            return stack_name, {
+                "success": False,
+                "error": f"Backup file not written: {e}"
+            }
+        return stack_name, {
+            "success": True,
+            "backup_file": str(backup_file),
+            "size": size
+        }
+    
+    return stack_name, {
+        "success": False,
+        "error": export_result.get("error", export_result.get("stderr"))
+    }
+
+def backup_infrastructure_state(show_secrets: bool = False,
+                                parallelism: int = DEFAULT_STACK_PARALLELISM) -> Dict[str, Any]:
     """Backup Pulumi state files"""
     click.echo("💾 Backing up infrastructure state...")
     
-    backup_dir = PLATFORM_DIR / "backups" / f"pulumi_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    backup_dir = PLATFORM_DIR / "backups" / f"pulumi_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}"
     backup_dir.mkdir(parents=True, exist_ok=True)
     
-    backups = {}
-    
-    for stack_name in STACK_CONFIGS.keys():
-        # Export stack state
-        export_result = run_pulumi_command(["stack", "export"], stack_name)
-        
-        if export_result["success"]:
-            backup_file = backup_dir / f"{stack_name}_state.json"
-            with open(backup_file, 'w') as f:
-                f.write(export_result["stdout"])
-            
-            backups[stack_name] = {
-                "success": True,
-                "backup_file": str(backup_file),
-                "size": len(export_result["stdout"])
-            }
-        else:
-            backups[stack_name] = {
-                "success": False,
-                "error": export_result.get("error", export_result.get("stderr"))
-            }
+    # The CLI writes each export directly to disk; stacks are exported concurrently
+    backups = _run_stack_workers(
+        partial(_backup_one_stack, backup_dir=backup_dir, show_secrets=show_secrets),
+        _ALL_STACKS,
+        parallelism
+    )
     
     return {
         "success": all(b.get("success", False) for b in backups.values()),
@@ -896,24 +1458,99 @@ def backup_infrastructure_state() -> Dict[str, Any]:
 # USER DATABASE PROVISIONING
 # ============================================================================
 
-def provision_user_database_access(user_profile=None, data_sources=None):
+@lru_cache(maxsize=32)
+def _cached_user_database_config(profile_key):
+    """get_user_database_config() memoized on a hashable view of the profile"""
+    return get_user_database_config(None if profile_key is None else dict(profile_key))
+
+# Only successful validations are reused, so finishing setup takes effect immediately
+@ttl_cache(seconds=PROBE_CACHE_SECONDS, cache_if=lambda result: result[0])
+def _cached_validate_user_database_config():
+    """validate_user_database_config() reused briefly once it has passed"""
+    return validate_user_database_config()
+
+def _user_profile_key(user_profile) -> Optional[tuple]:
+    """Hashable view of a user profile dict; raises TypeError for unhashable values"""
+    profile_key = None if user_profile is None else tuple(sorted(user_profile.items()))
+    hash(profile_key)
+    return profile_key
+
+def _get_user_database_config(user_profile=None) -> Dict[str, Any]:
+    """Return the user's database config, reusing earlier results for the same profile"""
+    try:
+        profile_key = _user_profile_key(user_profile)
+    except TypeError:
+        return get_user_database_config(user_profile)
+    
+    # Hand out a copy so callers can't mutate the cached entry
+    return dict(_cached_user_database_config(profile_key))
+
+@lru_cache(maxsize=1)
+def _shared_data_module():
+    """Import shared_data_module once, on first use (it imports this module at load time)"""
+    from modules import shared_data_module
+    return shared_data_module
+
+# Successful provisioning results, keyed by (profile, sources, schema prefix)
+PROVISION_CACHE_SIZE = 32
+_PROVISION_CACHE = OrderedDict()
+_PROVISION_CACHE_LOCK = threading.Lock()
+
+def _cached_provisioning(cache_key) -> Optional[Dict[str, Any]]:
+    """Return a cached provisioning result whose SQL script is still on disk"""
+    with _PROVISION_CACHE_LOCK:
+        cached = _PROVISION_CACHE.get(cache_key)
+        if cached is None:
+            return None
+        
+        if not cached["sql_script_file"] or not Path(cached["sql_script_file"]).exists():
+            del _PROVISION_CACHE[cache_key]
+            return None
+        
+        _PROVISION_CACHE.move_to_end(cache_key)
+    
+    # Hand out a copy so callers can't mutate the cached entry
+    return copy.deepcopy(cached)
+
+def _store_provisioning(cache_key, result: Dict[str, Any]) -> None:
+    """Remember a provisioning result, evicting the least recently used entry"""
+    with _PROVISION_CACHE_LOCK:
+        _PROVISION_CACHE[cache_key] = result
+        _PROVISION_CACHE.move_to_end(cache_key)
+        while len(_PROVISION_CACHE) > PROVISION_CACHE_SIZE:
+            _PROVISION_CACHE.popitem(last=False)
+
+def _evict_provisioning_script(script_file: str) -> None:
+    """Drop cached results whose SQL script was just rewritten (the path is per user, not per key)"""
+    with _PROVISION_CACHE_LOCK:
+        stale = [key for key, cached in _PROVISION_CACHE.items() if cached["sql_script_file"] == script_file]
+        for key in stale:
+            del _PROVISION_CACHE[key]
+
+def clear_user_database_config_cache() -> None:
+    """Forget memoized user database config/validation (e.g. after re-running setup)"""
+    _cached_user_database_config.cache_clear()
+    _cached_validate_user_database_config.cache_clear()
+    with _PROVISION_CACHE_LOCK:
+        _PROVISION_CACHE.clear()
+
+def provision_user_database_access(user_profile=None, data_sources=None, use_cache: bool = True):
     """Provision user-specific database schemas and access across shared instances"""
     if data_sources is None:
         data_sources = ["aws-postgres", "gcp-postgres", "azure-sqlserver"]
     
     try:
-        from config import get_user_database_config, validate_user_database_config
-        from modules.shared_data_module import create_user_database_schema
+        create_user_database_schema = _shared_data_module().create_user_database_schema
         
         # Validate user configuration
-        valid, messages = validate_user_database_config()
+        valid, messages = _cached_validate_user_database_config()
         if not valid:
             return {
                 "success": False,
                 "error": f"User configuration invalid: {'; '.join(messages)}"
             }
             
-        db_config = get_user_database_config(user_profile)
+        db_config = _get_user_database_config(user_profile)
         
     except ImportError as e:
         return {
@@ -921,17 +1558,34 @@ def provision_user_database_access(user_profile=None, data_sources=None):
             "error": f"Required modules not available: {str(e)}"
         }
     
+    try:
+        # Source order doesn't change what gets provisioned, so it isn't part of the key
+        cache_key = (_user_profile_key(user_profile), tuple(sorted(data_sources)), db_config["schema_prefix"])
+    except TypeError:
+        cache_key = None
+    
+    if use_cache and cache_key is not None:
+        cached = _cached_provisioning(cache_key)
+        if cached is not None:
+            click.echo(f"♻️  Database access already prepared for user: {db_config['schema_prefix']}")
+            click.echo(f"   • SQL script: {cached['sql_script_file']}")
+            return cached
+    
     click.echo(f"🔐 Provisioning database access for user: {db_config['schema_prefix']}")
     
     provisioning_results = {}
-    sql_scripts = {}
     
     for source_id in data_sources:
-        click.echo(f"   • Processing {source_id}...")
-        
-        # Generate schema creation commands
-        schema_result = create_user_database_schema(source_id, user_profile)
-        
+        _echo(f"   • Processing {source_id}...")
+    
+    # Generate schema creation commands for all sources concurrently;
+    # map() keeps the results in data_sources order
+    with ThreadPoolExecutor(max_workers=max(1, len(data_sources))) as executor:
+        schema_results = list(executor.map(
+            partial(create_user_database_schema, user_profile=user_profile), data_sources
+        ))
+    
+    for source_id, schema_result in zip(data_sources, schema_results):
         if schema_result["success"]:
             provisioning_results[source_id] = {
                 "success": True,
@@ -939,9 +1593,6 @@ def provision_user_database_access(user_profile=None, data_sources=None):
                 "database_user": schema_result["database_user"],
                 "sql_statements": schema_result["sql_statements"]
             }
-            
-            sql_scripts[source_id] = schema_result["sql_statements"]
-            
         else:
             provisioning_results[source_id] = {
                 "success": False,
@@ -949,9 +1600,12 @@ def provision_user_database_access(user_profile=None, data_sources=None):
             }
     
     # Generate consolidated SQL script for manual execution
-    script_file = _generate_user_provisioning_script(db_config, sql_scripts)
+    script_file = _generate_user_provisioning_script(db_config, provisioning_results)
+    if script_file:
+        # Other source sets for this user now point at a script with different contents
+        _evict_provisioning_script(script_file)
     
-    success_count = len([r for r in provisioning_results.values() if r["success"]])
+    success_count = sum(1 for r in provisioning_results.values() if r["success"])
     total_count = len(provisioning_results)
     
     click.echo(f"✅ User database provisioning prepared: {success_count}/{total_count} sources")
@@ -963,7 +1617,7 @@ def provision_user_database_access(user_profile=None, data_sources=None):
         click.echo(f"   3. Test catalog connectivity in Starburst")
         click.echo(f"   4. Update environment variables with user credentials")
     
-    return {
+    result = {
         "success": success_count == total_count,
         "user": db_config["schema_prefix"],
         "database_user": db_config["database_user"],
@@ -972,47 +1626,44 @@ def provision_user_database_access(user_profile=None, data_sources=None):
         "sources_processed": total_count,
         "sources_successful": success_count
     }
+    
+    # Only fully successful runs are reused; anything else is recomputed next time
+    if result["success"] and script_file and cache_key is not None:
+        _store_provisioning(cache_key, copy.deepcopy(result))
+    
+    return result
 
-def _generate_user_provisioning_script(db_config, sql_scripts):
+def _generate_user_provisioning_script(db_config, provisioning_results):
     """Generate consolidated SQL script for user database provisioning"""
-    script_content = []
-    
-    script_content.extend([
-        f"-- User Database Provisioning Script",
-        f"-- Generated: {datetime.now().isoformat()}",
-        f"-- User: {db_config['schema_prefix']}",
-        f"-- Database User: {db_config['database_user']}",
-        f"",
-        f"-- IMPORTANT: Execute these statements on the appropriate shared databases",
-        f"-- Make sure to update connection credentials after running these commands",
-        f""
-    ])
-    
-    for source_id, sql_statements in sql_scripts.items():
-        script_content.extend([
-            f"",
-            f"-- ===== {source_id.upper()} =====",
-            f""
-        ])
-        
-        for statement in sql_statements:
-            script_content.append(f"{statement}")
-    
-    script_content.extend([
-        f"",
-        f"-- Environment Variables to Set:",
-        f"-- export DB_USER_PASSWORD='user_password_123'",
-        f"-- export GCP_PROJECT='your-gcp-project'",
-        f"-- export GOOGLE_APPLICATION_CREDENTIALS='/path/to/service-account.json'",
-        f""
-    ])
-    
-    # Save script file
     script_file = OUTPUTS_DIR / f"user_provisioning_{db_config['username']}.sql"
     
     try:
-        with open(script_file, 'w') as f:
-            f.write('\n'.join(script_content))
+        # Stream each section straight into the file rather than joining one big string
+        with open(script_file, 'w', buffering=1 << 16) as f:
+            f.write(
+                f"-- User Database Provisioning Script\n"
+                f"-- Generated: {datetime.now().isoformat()}\n"
+                f"-- User: {db_config['schema_prefix']}\n"
+                f"-- Database User: {db_config['database_user']}\n"
+                f"\n"
+                f"-- IMPORTANT: Execute these statements on the appropriate shared databases\n"
+                f"-- Make sure to update connection credentials after running these commands\n"
+                f"\n"
+            )
+            
+            for source_id, result in provisioning_results.items():
+                if not result["success"]:
+                    continue
+                f.write(f"\n-- ===== {source_id.upper()} =====\n\n")
+                f.writelines(f"{statement}\n" for statement in result["sql_statements"])
+            
+            f.write(
+                "\n"
+                "-- Environment Variables to Set:\n"
+                "-- export DB_USER_PASSWORD='user_password_123'\n"
+                "-- export GCP_PROJECT='your-gcp-project'\n"
+                "-- export GOOGLE_APPLICATION_CREDENTIALS='/path/to/service-account.json'\n"
+            )
         return str(script_file)
     except Exception as e:
         click.echo(f"⚠️  Could not save SQL script: {str(e)}")
@@ -1021,10 +1672,9 @@ def _generate_user_provisioning_script(db_config, sql_scripts):
 def get_user_database_status(user_profile=None):
     """Get status of user's database schemas and access across clouds"""
     try:
-        from config import get_user_database_config
-        from modules.shared_data_module import get_user_data_summary
+        get_user_data_summary = _shared_data_module().get_user_data_summary
         
-        db_config = get_user_database_config(user_profile)
+        db_config = _get_user_database_config(user_profile)
         user_summary = get_user_data_summary(user_profile)
         
         if not user_summary["success"]:
@@ -1033,37 +1683,21 @@ def get_user_database_status(user_profile=None):
         summary = user_summary["summary"]
         
         # Get infrastructure status to check if shared databases are running
-        infra_status = get_infrastructure_status()
+        infra_status = _cached_infrastructure_status(("shared-databases",))
         
-        database_status = {}
+        stack_info = infra_status.get("stacks", {}).get("shared-databases")
+        outputs = stack_info.get("outputs", {}) if stack_info and stack_info.get("exists") else {}
         
-        for stack_name, stack_info in infra_status.get("stacks", {}).items():
-            if stack_name == "shared-databases" and stack_info.get("exists"):
-                outputs = stack_info.get("outputs", {})
-                
-                # Check AWS databases
-                if "aws_endpoints" in outputs:
-                    database_status["aws"] = {
-                        "infrastructure_ready": True,
-                        "endpoints": outputs["aws_endpoints"],
-                        "user_schema_status": "needs_provisioning"  # Would need to check actual DB
-                    }
-                
-                # Check GCP databases  
-                if "gcp_endpoints" in outputs:
-                    database_status["gcp"] = {
-                        "infrastructure_ready": True,
-                        "endpoints": outputs["gcp_endpoints"],
-                        "user_schema_status": "needs_provisioning"
-                    }
-                
-                # Check Azure databases
-                if "azure_endpoints" in outputs:
-                    database_status["azure"] = {
-                        "infrastructure_ready": True,
-                        "endpoints": outputs["azure_endpoints"], 
-                        "user_schema_status": "needs_provisioning"
-                    }
+        # One entry per cloud that exports endpoints; user schema state would need a DB check
+        database_status = {
+            cloud: {
+                "infrastructure_ready": True,
+                "endpoints": outputs[f"{cloud}_endpoints"],
+                "user_schema_status": "needs_provisioning"
+            }
+            for cloud in _ALL_CLOUDS
+            if f"{cloud}_endpoints" in outputs
+        }
         
         return {
             "success": True,
@@ -1081,14 +1715,30 @@ def get_user_database_status(user_profile=None):
             "error": f"Failed to get user database status: {str(e)}"
         }
 
+# Cleanup SQL templates per database dialect (matched against source_id parts)
+_ANSI_CLEANUP = (
+    "DROP SCHEMA IF EXISTS {schema} CASCADE;",
+    "DROP USER IF EXISTS {user};"
+)
+_TSQL_CLEANUP = (
+    "DROP SCHEMA [{schema}];",
+    "DROP USER [{user}];"
+)
+_DIALECT_CLEANUP = {
+    "postgres": _ANSI_CLEANUP,
+    "mysql": _ANSI_CLEANUP,
+    "sqlserver": _TSQL_CLEANUP,
+    "synapse": _TSQL_CLEANUP,
+    "bigquery": ("-- BigQuery dataset: {schema} (delete via API or Console)",)
+}
+
 def cleanup_user_database_access(user_profile=None, data_sources=None):
     """Remove user-specific database schemas and access (for cleanup/reset)"""
     if data_sources is None:
         data_sources = ["aws-postgres", "gcp-postgres", "azure-sqlserver"]
     
     try:
-        from config import get_user_database_config
-        db_config = get_user_database_config(user_profile)
+        db_config = _get_user_database_config(user_profile)
     except ImportError:
         return {
             "success": False,
@@ -1098,34 +1748,22 @@ def cleanup_user_database_access(user_profile=None, data_sources=None):
     click.echo(f"🧹 Cleaning up database access for user: {db_config['schema_prefix']}")
     
     cleanup_results = {}
-    sql_scripts = {}
     
     for source_id in data_sources:
-        # Generate cleanup SQL statements
-        cleanup_sql = []
-        
-        if "postgres" in source_id or "mysql" in source_id:
-            cleanup_sql.extend([
-                f"DROP SCHEMA IF EXISTS {db_config['default_schema']} CASCADE;",
-                f"DROP USER IF EXISTS {db_config['database_user']};"
-            ])
-        elif "sqlserver" in source_id or "synapse" in source_id:
-            cleanup_sql.extend([
-                f"DROP SCHEMA [{db_config['default_schema']}];",
-                f"DROP USER [{db_config['database_user']}];"
-            ])
-        elif "bigquery" in source_id:
-            cleanup_sql.append(f"-- BigQuery dataset: {db_config['default_schema']} (delete via API or Console)")
+        # Generate cleanup SQL statements for the source's dialect
+        dialect = next((part for part in source_id.split("-") if part in _DIALECT_CLEANUP), None)
+        cleanup_sql = [
+            template.format(schema=db_config['default_schema'], user=db_config['database_user'])
+            for template in _DIALECT_CLEANUP.get(dialect, ())
+        ]
         
         cleanup_results[source_id] = {
             "success": True,
             "sql_statements": cleanup_sql
         }
-        
-        sql_scripts[source_id] = cleanup_sql
     
     # Generate cleanup script
-    script_file = _generate_user_cleanup_script(db_config, sql_scripts)
+    script_file = _generate_user_cleanup_script(db_config, cleanup_results)
     
     click.echo(f"✅ User database cleanup script generated")
     if script_file:
@@ -1139,34 +1777,25 @@ def cleanup_user_database_access(user_profile=None, data_sources=None):
         "sql_script_file": script_file
     }
 
-def _generate_user_cleanup_script(db_config, sql_scripts):
+def _generate_user_cleanup_script(db_config, cleanup_results):
     """Generate consolidated SQL script for user database cleanup"""
-    script_content = [
-        f"-- User Database Cleanup Script",
-        f"-- Generated: {datetime.now().isoformat()}", 
-        f"-- User: {db_config['schema_prefix']}",
-        f"",
-        f"-- WARNING: This will permanently delete user schemas and data",
-        f"-- Make sure to backup any important data before running",
-        f""
-    ]
-    
-    for source_id, sql_statements in sql_scripts.items():
-        script_content.extend([
-            f"",
-            f"-- ===== {source_id.upper()} CLEANUP =====",
-            f""
-        ])
-        
-        for statement in sql_statements:
-            script_content.append(f"{statement}")
-    
-    # Save cleanup script
     script_file = OUTPUTS_DIR / f"user_cleanup_{db_config['username']}.sql"
     
     try:
-        with open(script_file, 'w') as f:
-            f.write('\n'.join(script_content))
+        with open(script_file, 'w', buffering=1 << 16) as f:
+            f.write(
+                f"-- User Database Cleanup Script\n"
+                f"-- Generated: {datetime.now().isoformat()}\n"
+                f"-- User: {db_config['schema_prefix']}\n"
+                f"\n"
+                f"-- WARNING: This will permanently delete user schemas and data\n"
+                f"-- Make sure to backup any important data before running\n"
+                f"\n"
+            )
+            
+            for source_id, result in cleanup_results.items():
+                f.write(f"\n-- ===== {source_id.upper()} CLEANUP =====\n\n")
+                f.writelines(f"{statement}\n" for statement in result["sql_statements"])
         return str(script_file)
     except Exception:
-        return None
\ No newline at end of file
+        return None
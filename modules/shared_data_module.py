@@ -4,8 +4,8 @@ to Pulumi-provisioned databases across AWS, GCP, and Azure.
 """
 
 import click
+import copy
 import json
-import subprocess
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
@@ -18,15 +18,26 @@ from config import PlatformConfig, PLATFORM_DIR
 # Try to import from other modules with fallback
 try:
     from modules.pulumi_module import get_stack_outputs, get_database_endpoints, get_infrastructure_status
+    # TTL-cached in pulumi_module and invalidated there when stacks change
+    from modules.pulumi_module import check_pulumi_available, validate_cloud_credentials, get_cached_infrastructure_status
 except ImportError:
     # Fallback functions if pulumi_module is not available
+    def check_pulumi_available() -> bool:
+        return False
+    
+    def validate_cloud_credentials(force: bool = False) -> Dict[str, bool]:
+        return {}
+    
     def get_stack_outputs(stack_name: str) -> Dict[str, Any]:
         return {}
     
     def get_database_endpoints() -> Dict[str, Any]:
         return {}
     
-    def get_infrastructure_status() -> Dict[str, Any]:
+    def get_infrastructure_status(check_credentials: bool = False) -> Dict[str, Any]:
+        return {"error": "Pulumi module not available"}
+    
+    def get_cached_infrastructure_status() -> Dict[str, Any]:
         return {"error": "Pulumi module not available"}
 
 # Data source profiles directory
@@ -85,52 +96,111 @@ DATA_SOURCE_TYPES = {
     }
 }
 
+# Sample dataset descriptions shared by all data sources
+_DATASET_INFO = {
+    "tpch": {
+        "name": "TPC-H Decision Support Benchmark",
+        "description": "Industry standard benchmark for decision support systems",
+        "tables": ["customer", "lineitem", "nation", "orders", "part", "partsupp", "region", "supplier"],
+        "size": "1GB",
+        "use_case": "Performance testing, query optimization"
+    },
+    "tpcds": {
+        "name": "TPC-DS Decision Support Benchmark", 
+        "description": "Advanced benchmark for business intelligence workloads",
+        "tables": ["catalog_sales", "store_sales", "web_sales", "customer", "item", "store", "warehouse"],
+        "size": "10GB",
+        "use_case": "Complex analytics, BI dashboard testing"
+    },
+    "northwind": {
+        "name": "Northwind Traders Sample Database",
+        "description": "Classic sample database with business data",
+        "tables": ["customers", "employees", "orders", "products", "suppliers", "categories"],
+        "size": "5MB",
+        "use_case": "Application development, learning SQL"
+    },
+    "sakila": {
+        "name": "Sakila DVD Rental Database",
+        "description": "Sample database for DVD rental business",
+        "tables": ["actor", "film", "customer", "rental", "payment", "inventory"],
+        "size": "3MB", 
+        "use_case": "Learning joins, complex queries"
+    },
+    "employees": {
+        "name": "Employee Sample Database",
+        "description": "Large employee database with historical data",
+        "tables": ["employees", "salaries", "titles", "departments", "dept_emp", "dept_manager"],
+        "size": "160MB",
+        "use_case": "Time series analysis, HR analytics"
+    },
+    "world": {
+        "name": "World Database",
+        "description": "Geographic and demographic world data",
+        "tables": ["country", "city", "countrylanguage"],
+        "size": "1MB",
+        "use_case": "Geographic queries, demographic analysis"
+    },
+    "adventureworks": {
+        "name": "AdventureWorks Sample Database",
+        "description": "Microsoft's comprehensive business sample database",
+        "tables": ["person", "product", "sales", "purchasing", "humanresources"],
+        "size": "180MB",
+        "use_case": "Enterprise scenarios, complex business logic"
+    },
+    "public_datasets": {
+        "name": "BigQuery Public Datasets",
+        "description": "Google's collection of public datasets",
+        "tables": ["Various public tables"],
+        "size": "Multi-TB",
+        "use_case": "Real-world data analysis, research"
+    },
+    "covid19": {
+        "name": "COVID-19 Data",
+        "description": "Comprehensive COVID-19 datasets",
+        "tables": ["cases", "deaths", "vaccinations", "mobility"],
+        "size": "100MB",
+        "use_case": "Time series analysis, public health research"
+    },
+    "census": {
+        "name": "US Census Data",
+        "description": "US Census Bureau demographic data",
+        "tables": ["population", "demographics", "economic_data"],
+        "size": "500MB",
+        "use_case": "Demographic analysis, market research"
+    },
+    "retail_analytics": {
+        "name": "Retail Analytics Dataset",
+        "description": "Synthetic retail transaction data",
+        "tables": ["transactions", "customers", "products", "stores"],
+        "size": "2GB",
+        "use_case": "Retail analytics, customer segmentation"
+    },
+    "iot_data": {
+        "name": "IoT Sensor Data",
+        "description": "Time series IoT sensor measurements",
+        "tables": ["sensor_readings", "devices", "locations"],
+        "size": "5GB",
+        "use_case": "IoT analytics, time series forecasting"
+    }
+}
+
+# Per-source dataset listings, built once at import
+_DATASETS_BY_SOURCE = {
+    source_id: [
+        {"name": dataset_name, **_DATASET_INFO[dataset_name]}
+        for dataset_name in source_config["sample_datasets"]
+        if dataset_name in _DATASET_INFO
+    ]
+    for source_id, source_config in DATA_SOURCE_TYPES.items()
+}
+
 def get_available_clouds() -> Dict[str, bool]:
     """Check which cloud credentials are available"""
-    try:
-        infra_status = get_infrastructure_status()
-        return infra_status.get("credentials", {})
-    except Exception:
-        # Fallback credential check
-        clouds = {}
-        
-        # Check AWS
-        try:
-            result = subprocess.run(
-                ["aws", "sts", "get-caller-identity"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            clouds["aws"] = result.returncode == 0
-        except Exception:
-            clouds["aws"] = False
-        
-        # Check GCP
-        try:
-            result = subprocess.run(
-                ["gcloud", "auth", "list", "--filter=status:ACTIVE"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            clouds["gcp"] = result.returncode == 0 and "ACTIVE" in result.stdout
-        except Exception:
-            clouds["gcp"] = False
-        
-        # Check Azure
-        try:
-            result = subprocess.run(
-                ["az", "account", "show"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            clouds["azure"] = result.returncode == 0
-        except Exception:
-            clouds["azure"] = False
-        
-        return clouds
+    # Same result as get_infrastructure_status(check_credentials=True)["credentials"],
+    # without listing stacks; both checks are cached in pulumi_module
+    if not check_pulumi_available():
+        return {}
+    return validate_cloud_credentials()
 
 def list_available_sources() -> Dict[str, Any]:
     """List all available shared data sources"""
@@ -138,7 +208,7 @@ def list_available_sources() -> Dict[str, Any]:
     
     # Get actual infrastructure status
     try:
-        infra_status = get_infrastructure_status()
+        infra_status = get_cached_infrastructure_status()
         deployed_stacks = infra_status.get("stacks", {})
     except Exception:
         deployed_stacks = {}
@@ -593,103 +663,8 @@ def get_sample_datasets_info(source_id: str) -> Dict[str, Any]:
         }
     
     source_config = DATA_SOURCE_TYPES[source_id]
-    datasets = []
-    
-    # Define dataset information
-    dataset_info = {
-        "tpch": {
-            "name": "TPC-H Decision Support Benchmark",
-            "description": "Industry standard benchmark for decision support systems",
-            "tables": ["customer", "lineitem", "nation", "orders", "part", "partsupp", "region", "supplier"],
-            "size": "1GB",
-            "use_case": "Performance testing, query optimization"
-        },
-        "tpcds": {
-            "name": "TPC-DS Decision Support Benchmark", 
-            "description": "Advanced benchmark for business intelligence workloads",
-            "tables": ["catalog_sales", "store_sales", "web_sales", "customer", "item", "store", "warehouse"],
-            "size": "10GB",
-            "use_case": "Complex analytics, BI dashboard testing"
-        },
-        "northwind": {
-            "name": "Northwind Traders Sample Database",
-            "description": "Classic sample database with business data",
-            "tables": ["customers", "employees", "orders", "products", "suppliers", "categories"],
-            "size": "5MB",
-            "use_case": "Application development, learning SQL"
-        },
-        "sakila": {
-            "name": "Sakila DVD Rental Database",
-            "description": "Sample database for DVD rental business",
-            "tables": ["actor", "film", "customer", "rental", "payment", "inventory"],
-            "size": "3MB", 
-            "use_case": "Learning joins, complex queries"
-        },
-        "employees": {
-            "name": "Employee Sample Database",
-            "description": "Large employee database with historical data",
-            "tables": ["employees", "salaries", "titles", "departments", "dept_emp", "dept_manager"],
-            "size": "160MB",
-            "use_case": "Time series analysis, HR analytics"
-        },
-        "world": {
-            "name": "World Database",
-            "description": "Geographic and demographic world data",
-            "tables": ["country", "city", "countrylanguage"],
-            "size": "1MB",
-            "use_case": "Geographic queries, demographic analysis"
-        },
-        "adventureworks": {
-            "name": "AdventureWorks Sample Database",
-            "description": "Microsoft's comprehensive business sample database",
-            "tables": ["person", "product", "sales", "purchasing", "humanresources"],
-            "size": "180MB",
-            "use_case": "Enterprise scenarios, complex business logic"
-        },
-        "public_datasets": {
-            "name": "BigQuery Public Datasets",
-            "description": "Google's collection of public datasets",
-            "tables": ["Various public tables"],
-            "size": "Multi-TB",
-            "use_case": "Real-world data analysis, research"
-        },
-        "covid19": {
-            "name": "COVID-19 Data",
-            "description": "Comprehensive COVID-19 datasets",
-            "tables": ["cases", "deaths", "vaccinations", "mobility"],
-            "size": "100MB",
-            "use_case": "Time series analysis, public health research"
-        },
-        "census": {
-            "name": "US Census Data",
-            "description": "US Census Bureau demographic data",
-            "tables": ["population", "demographics", "economic_data"],
-            "size": "500MB",
-            "use_case": "Demographic analysis, market research"
-        },
-        "retail_analytics": {
-            "name": "Retail Analytics Dataset",
-            "description": "Synthetic retail transaction data",
-            "tables": ["transactions", "customers", "products", "stores"],
-            "size": "2GB",
-            "use_case": "Retail analytics, customer segmentation"
-        },
-        "iot_data": {
-            "name": "IoT Sensor Data",
-            "description": "Time series IoT sensor measurements",
-            "tables": ["sensor_readings", "devices", "locations"],
-            "size": "5GB",
-            "use_case": "IoT analytics, time series forecasting"
-        }
-    }
-    
-    # Get datasets available for this source
-    for dataset_name in source_config["sample_datasets"]:
-        if dataset_name in dataset_info:
-            datasets.append({
-                "name": dataset_name,
-                **dataset_info[dataset_name]
-            })
+    # Deep copy so callers can't mutate the shared records (or their table lists)
+    datasets = copy.deepcopy(_DATASETS_BY_SOURCE[source_id])
     
     return {
         "success": True,
@@ -7,18 +7,71 @@ import click
 import json
 import os
 import subprocess
+import tempfile
 import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
 import boto3
 from botocore.exceptions import NoCredentialsError
 
+# Optional orjson support for faster JSON parsing and serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import from parent directory
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
 from config import PLATFORM_DIR, LOCAL_CLUSTERS_DIR
 
 
+# Process umask, read once at import since os.umask() can only be queried by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _target_mode(path):
+    """Mode for a rewritten file: keep the existing one, else what open() would create"""
+    try:
+        return path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def atomic_write_bytes(path, payload):
+    """Write bytes to a temp file in the same directory, then rename it into place"""
+    path = Path(path)
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", delete=False) as tmp:
+        try:
+            # NamedTemporaryFile creates 0600 files; match a plain open() instead
+            os.fchmod(tmp.fileno(), _target_mode(path))
+            tmp.write(payload)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        except BaseException:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+    os.replace(tmp.name, path)
+
+
+def load_json(data):
+    """Parse JSON from str or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json_file(path, data):
+    """Atomically write data to a JSON file with 2-space indentation"""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode()
+    atomic_write_bytes(path, payload)
+
+
 def validate_aws_credentials():
     """Ensure AWS credentials are available and get account info"""
     try:
@@ -65,9 +65,10 @@ def destroy_local_cluster(name, force):
     click.echo(f"✅ Local cluster '{name}' destroyed")
 
 @local.command("list")
-def list_local_clusters_cmd():
+@click.option("--verify", is_flag=True, help="Cross-check with 'kind get clusters' and include external clusters")
+def list_local_clusters_cmd(verify):
     """List local Kind clusters"""
-    clusters = list_local_clusters()
+    clusters = list_local_clusters(verify_with_kind=verify)
 
     if not clusters:
         click.echo("No local clusters found")
@@ -0,0 +1,45 @@
+"""
+Tests for Kind cluster configuration rendering and batch creation checks.
+"""
+
+import pytest
+import yaml
+
+from modules import local_cluster_module
+from modules.local_cluster_module import CLUSTER_PRESETS, generate_kind_config, render_kind_config
+
+
+@pytest.mark.parametrize("preset", list(CLUSTER_PRESETS))
+def test_render_kind_config_matches_generate(preset):
+    rendered = yaml.safe_load(render_kind_config("dev-cluster", preset))
+    assert rendered == generate_kind_config("dev-cluster", preset)
+
+
+@pytest.mark.parametrize("cluster_name", [
+    "dev",
+    "team-a-repro-1234",
+    "{braces}",
+    "name: with colon",
+    'quote"d',
+    "yes",
+    "123"
+])
+def test_render_kind_config_escapes_cluster_name(cluster_name):
+    rendered = yaml.safe_load(render_kind_config(cluster_name, "development"))
+    assert rendered == generate_kind_config(cluster_name, "development")
+
+
+def test_render_kind_config_unknown_preset():
+    with pytest.raises(ValueError):
+        render_kind_config("dev", "no-such-preset")
+
+
+def test_create_kind_clusters_empty():
+    assert local_cluster_module.create_kind_clusters([]) == {}
+
+
+def test_create_kind_clusters_rejects_fixed_port_batches(monkeypatch):
+    # Must fail before touching docker
+    monkeypatch.setattr(local_cluster_module, "check_docker_available", pytest.fail)
+    with pytest.raises(ValueError, match="fixed host ports"):
+        local_cluster_module.create_kind_clusters(["a", "b"], "development")
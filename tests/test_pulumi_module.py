@@ -0,0 +1,139 @@
+"""
+Tests for pulumi_module caching: stack output TTL invalidation and the
+user provisioning result cache.
+"""
+
+import pytest
+
+from modules import pulumi_module
+
+
+@pytest.fixture(autouse=True)
+def clean_caches(monkeypatch, tmp_path):
+    """Run against the CLI code path with empty caches and a scratch outputs dir"""
+    monkeypatch.setattr(pulumi_module, "auto", None)
+    monkeypatch.setattr(pulumi_module, "OUTPUTS_DIR", tmp_path)
+    pulumi_module.get_stack_outputs.cache_clear()
+    pulumi_module._cached_infrastructure_status.cache_clear()
+    with pulumi_module._PROVISION_CACHE_LOCK:
+        pulumi_module._PROVISION_CACHE.clear()
+    yield
+    pulumi_module.get_stack_outputs.cache_clear()
+    pulumi_module._cached_infrastructure_status.cache_clear()
+    with pulumi_module._PROVISION_CACHE_LOCK:
+        pulumi_module._PROVISION_CACHE.clear()
+
+
+@pytest.fixture
+def pulumi_cli(monkeypatch):
+    """Fake run_pulumi_command recording calls; outputs grow on every read"""
+    calls = []
+
+    def fake_run(command, stack_name=None, **kwargs):
+        calls.append(command)
+        if command[:2] == ["stack", "output"]:
+            reads = sum(1 for c in calls if c[:2] == ["stack", "output"])
+            return {"success": True, "stdout": f'{{"reads": {reads}}}', "stderr": ""}
+        return {"success": True, "stdout": "", "stderr": ""}
+
+    monkeypatch.setattr(pulumi_module, "run_pulumi_command", fake_run)
+    return calls
+
+
+def test_stack_outputs_are_cached(pulumi_cli):
+    assert pulumi_module.get_stack_outputs("connectivity") == {"reads": 1}
+    assert pulumi_module.get_stack_outputs("connectivity") == {"reads": 1}
+    assert len(pulumi_cli) == 1
+
+
+def test_stack_outputs_are_copies(pulumi_cli):
+    outputs = pulumi_module.get_stack_outputs("connectivity")
+    outputs["reads"] = 99
+    assert pulumi_module.get_stack_outputs("connectivity") == {"reads": 1}
+
+
+def test_config_set_all_invalidates_stack_outputs(pulumi_cli):
+    assert pulumi_module.get_stack_outputs("connectivity") == {"reads": 1}
+
+    result = pulumi_module.run_pulumi_config_set_all("connectivity", {"aws:region": "us-west-2"})
+
+    assert result["success"]
+    assert pulumi_module.get_stack_outputs("connectivity") == {"reads": 2}
+
+
+def test_config_set_all_only_invalidates_its_stack(pulumi_cli):
+    pulumi_module.get_stack_outputs("connectivity")
+    pulumi_module.get_stack_outputs("shared-databases")
+
+    pulumi_module.run_pulumi_config_set_all("connectivity", {"aws:region": "us-west-2"})
+
+    assert pulumi_module.get_stack_outputs("shared-databases") == {"reads": 2}
+    assert pulumi_module.get_stack_outputs("connectivity") == {"reads": 3}
+
+
+@pytest.fixture
+def provisioning(monkeypatch):
+    """Stub the user config and schema generation used by provisioning"""
+    db_config = {
+        "username": "jdoe",
+        "schema_prefix": "jdoe",
+        "database_user": "jdoe_user"
+    }
+
+    def create_schema(source_id, user_profile=None):
+        return {
+            "success": True,
+            "schema_name": f"jdoe_{source_id}",
+            "database_user": "jdoe_user",
+            "sql_statements": [f"-- schema for {source_id}"]
+        }
+
+    shared_data = type("SharedData", (), {"create_user_database_schema": staticmethod(create_schema)})
+    monkeypatch.setattr(pulumi_module, "_shared_data_module", lambda: shared_data)
+    monkeypatch.setattr(pulumi_module, "_cached_validate_user_database_config", lambda: (True, []))
+    monkeypatch.setattr(pulumi_module, "_get_user_database_config", lambda user_profile=None: dict(db_config))
+
+
+def _script_text(result):
+    with open(result["sql_script_file"]) as f:
+        return f.read()
+
+
+def test_provisioning_cache_hit_returns_copy(provisioning):
+    first = pulumi_module.provision_user_database_access(data_sources=["aws-postgres"])
+    first["provisioning_results"].clear()
+
+    second = pulumi_module.provision_user_database_access(data_sources=["aws-postgres"])
+
+    assert "aws-postgres" in second["provisioning_results"]
+
+
+def test_provisioning_cache_ignores_source_order(provisioning):
+    pulumi_module.provision_user_database_access(data_sources=["aws-postgres", "gcp-postgres"])
+    pulumi_module.provision_user_database_access(data_sources=["gcp-postgres", "aws-postgres"])
+
+    assert len(pulumi_module._PROVISION_CACHE) == 1
+
+
+def test_provisioning_cache_not_stale_after_script_rewrite(provisioning):
+    first = pulumi_module.provision_user_database_access(data_sources=["aws-postgres"])
+    second = pulumi_module.provision_user_database_access(data_sources=["gcp-postgres"])
+
+    # Both source sets share the per-user script path
+    assert first["sql_script_file"] == second["sql_script_file"]
+
+    again = pulumi_module.provision_user_database_access(data_sources=["aws-postgres"])
+
+    script = _script_text(again)
+    assert "-- schema for aws-postgres" in script
+    assert "-- schema for gcp-postgres" not in script
+
+
+def test_provisioning_cache_dropped_when_script_deleted(provisioning, tmp_path):
+    first = pulumi_module.provision_user_database_access(data_sources=["aws-postgres"])
+    (tmp_path / "user_provisioning_jdoe.sql").unlink()
+
+    again = pulumi_module.provision_user_database_access(data_sources=["aws-postgres"])
+
+    assert again["sql_script_file"] == first["sql_script_file"]
+    assert "-- schema for aws-postgres" in _script_text(again)